@@ -5,50 +5,201 @@ A professional tool for digital forensics, investigative journalism, and photogr
 """
 
 import os
-import exifread
-from PIL import Image, ExifTags, ImageQt
+import re
+from PIL import Image, ExifTags
 from datetime import datetime
+from fractions import Fraction
+from collections import OrderedDict
+from pathlib import Path
 import json
+import copy
+import argparse
 import sys
 import platform
+import time
 import hashlib
-import webbrowser
+import mmap
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from contextlib import closing, contextmanager, nullcontext
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                            QLabel, QPushButton, QTextEdit, QFileDialog, QTabWidget, 
+                            QLabel, QPushButton, QTextEdit, QPlainTextEdit, QFileDialog, QTabWidget, QCheckBox,
                             QTreeWidget, QTreeWidgetItem, QProgressBar, QMessageBox,
-                            QLineEdit, QGroupBox, QScrollArea, QSizePolicy, QSplitter)
-from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve, QSize, QTimer
-from PyQt5.QtGui import QPixmap, QIcon, QFont, QColor, QPalette, QFontDatabase
+                            QGroupBox, QSplitter)
+from PyQt5.QtCore import Qt, QSize, QTimer, QEvent, QUrl, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QPixmap, QImage, QFont, QColor, QFontDatabase, QDesktopServices
+
+try:
+    import hyperscan  # Optional: single-pass SIMD multi-pattern scanning
+except ImportError:
+    hyperscan = None
+
+try:
+    from blake3 import blake3  # Optional: SIMD + multithreaded hashing
+except ImportError:
+    blake3 = None
+
+try:
+    import xxhash  # Optional: very fast non-cryptographic quick fingerprint
+except ImportError:
+    xxhash = None
+
+try:
+    import orjson  # Optional: much faster JSON serialization for large reports
+except ImportError:
+    orjson = None
 
 # ======================
 # 🛠️ HELPER FUNCTIONS
 # ======================
 
-def calculate_file_hashes(file_path):
-    """Calculate various cryptographic hashes for forensic verification"""
-    hash_functions = {
-        'MD5': hashlib.md5(),
-        'SHA1': hashlib.sha1(),
-        'SHA256': hashlib.sha256(),
-        'SHA512': hashlib.sha512(),
-        'BLAKE2b': hashlib.blake2b(),
-        'BLAKE2s': hashlib.blake2s()
-    }
+# Supported integrity hashes. BLAKE2b is slightly faster than SHA-256 in
+# hashlib, so together they give a modern pair at modest cost.
+HASH_ALGORITHMS = {
+    'MD5': hashlib.md5,
+    'SHA1': hashlib.sha1,
+    'SHA256': hashlib.sha256,
+    'BLAKE2b': hashlib.blake2b
+}
+DEFAULT_HASH_ALGORITHMS = ('SHA256', 'BLAKE2b')
+LEGACY_HASH_ALGORITHMS = ('MD5', 'SHA1')  # Only for matching older case records
+if blake3 is not None:
+    # Several times faster than BLAKE2b on SIMD-capable CPUs
+    HASH_ALGORITHMS['BLAKE3'] = blake3
+    DEFAULT_HASH_ALGORITHMS += ('BLAKE3',)
+
+# BLAKE3 hashes inputs above this size on all cores
+BLAKE3_THREADING_THRESHOLD = 1 << 20  # 1 MiB
+
+@contextmanager
+def open_mapped(file_path):
+    """Memory-map a file read-only so several analyses can share one read"""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''  # mmap cannot map empty files
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                # Hashing and the marker scan read front to back: large kernel
+                # read-ahead instead of a page fault per 4 KiB
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            yield mapped
+
+def _digest_buffer(hash_func, buffer):
+    """Hash a bytes-like buffer with one algorithm (runs in a worker thread)"""
+    # One-shot constructor: a single C call per digest, no update loop.
+    # hashlib releases the GIL on large buffers, so workers overlap.
+    if hash_func is blake3 and len(buffer) > BLAKE3_THREADING_THRESHOLD:
+        return blake3(buffer, max_threads=blake3.AUTO).hexdigest()
+    return hash_func(buffer).hexdigest()
+
+# Opt-in (AIM_HASH_CACHE=1 or --hash-cache): digests are remembered per
+# (device, inode, size, mtime) across sessions, so a file rewritten with the
+# same size and mtime would be reported with its old digests
+HASH_CACHE_PATH = Path.home() / '.cache' / 'aim-forensic' / 'hashes.db'
+
+def _open_hash_cache():
+    """Open (and create if needed) the persistent hash cache database"""
+    HASH_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(HASH_CACHE_PATH), timeout=5)
+    conn.execute("""CREATE TABLE IF NOT EXISTS hashes (
+                        dev INTEGER, ino INTEGER, size INTEGER, mtime_ns INTEGER,
+                        algorithm TEXT, digest TEXT,
+                        PRIMARY KEY (dev, ino, size, mtime_ns, algorithm))""")
+    return conn
+
+def _hash_cache_key(file_stats):
+    return (file_stats.st_dev, file_stats.st_ino, file_stats.st_size, file_stats.st_mtime_ns)
+
+def load_cached_hashes(file_stats, algos):
+    """Return previously calculated digests for an unchanged file"""
+    if not os.environ.get('AIM_HASH_CACHE'):
+        return {}
+    try:
+        with closing(_open_hash_cache()) as conn:
+            rows = conn.execute("SELECT algorithm, digest FROM hashes "
+                                "WHERE dev=? AND ino=? AND size=? AND mtime_ns=?",
+                                _hash_cache_key(file_stats)).fetchall()
+    except (sqlite3.Error, OSError):
+        return {}
+    return {name: digest for name, digest in rows if name in algos}
+
+def store_cached_hashes(file_stats, hashes):
+    """Remember successful digests, dropping entries for older versions of the file"""
+    if not os.environ.get('AIM_HASH_CACHE'):
+        return
+    key = _hash_cache_key(file_stats)
+    rows = [key + (name, digest) for name, digest in hashes.items()
+            if not digest.startswith("Error:")]
+    if not rows:
+        return
+    try:
+        with closing(_open_hash_cache()) as conn, conn:
+            conn.execute("DELETE FROM hashes WHERE dev=? AND ino=? AND NOT (size=? AND mtime_ns=?)", key)
+            conn.executemany("INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?, ?, ?)", rows)
+    except (sqlite3.Error, OSError):
+        pass
+
+def calculate_file_hashes(source, algos=DEFAULT_HASH_ALGORITHMS, file_stats=None):
+    """Calculate the requested cryptographic hashes for forensic verification
+    
+    `source` is either a file path or an already mapped bytes-like buffer.
+    Pass the buffer's `file_stats` to reuse digests from the hash cache.
+    """
+    hash_functions = {name: HASH_ALGORITHMS[name] for name in algos}
     
     hashes = {}
     try:
-        with open(file_path, 'rb') as f:
-            while chunk := f.read(8192):
-                for hash_func in hash_functions.values():
-                    hash_func.update(chunk)
-        
-        for name, hash_func in hash_functions.items():
-            hashes[name] = hash_func.hexdigest()
+        if isinstance(source, (str, os.PathLike)):
+            file_stats = os.stat(source)
+            cached = load_cached_hashes(file_stats, algos)
+            if len(cached) == len(hash_functions):
+                return {name: cached[name] for name in algos}
+            with open_mapped(source) as buffer:
+                return calculate_file_hashes(buffer, algos, file_stats)
+        
+        if file_stats is not None:
+            hashes = load_cached_hashes(file_stats, algos)
+            hash_functions = {name: func for name, func in hash_functions.items()
+                              if name not in hashes}
+        
+        with memoryview(source) as view:
+            with ThreadPoolExecutor(max_workers=max(1, len(hash_functions))) as pool:
+                futures = {name: pool.submit(_digest_buffer, hash_func, view)
+                           for name, hash_func in hash_functions.items()}
+                for name, future in futures.items():
+                    try:
+                        hashes[name] = future.result()
+                    except Exception as e:
+                        hashes[name] = f"Error: {str(e)}"
+        if file_stats is not None and hash_functions:
+            store_cached_hashes(file_stats, {name: hashes[name] for name in hash_functions})
     except Exception as e:
         for name in hash_functions.keys():
             hashes[name] = f"Error: {str(e)}"
     
-    return hashes
+    return {name: hashes[name] for name in algos}
+
+def quick_fingerprint(buffer):
+    """Fast dedup fingerprint of a mapped file, or None without xxhash/blake3
+    
+    Not a substitute for the cryptographic integrity hashes.
+    """
+    if xxhash is not None:
+        return f"XXH3-128: {xxhash.xxh3_128(buffer).hexdigest()}"
+    if blake3 is not None:
+        return f"BLAKE3: {_digest_buffer(blake3, buffer)}"
+    return None
+
+def dms_to_degrees(coord):
+    """Degrees/minutes/seconds triple (IFDRationals, numbers or "d,m,s" text) to decimal degrees"""
+    try:
+        degrees, minutes, seconds = map(float, coord.split(',') if isinstance(coord, str) else coord)
+    except (TypeError, ValueError):
+        return float(coord)  # Already decimal degrees
+    return degrees + minutes * (1 / 60) + seconds * (1 / 3600)
 
 def convert_gps_coordinates(gps_data):
     """Converts GPS coordinates from EXIF format to decimal degrees with enhanced error handling"""
@@ -58,21 +209,11 @@ def convert_gps_coordinates(gps_data):
         longitude = gps_data['GPSLongitude']
         long_ref = gps_data['GPSLongitudeRef']
         
-        # Handle different GPS coordinate formats
-        def convert_coord(coord):
-            if isinstance(coord, tuple) or isinstance(coord, list):
-                return float(coord[0]) + float(coord[1])/60 + float(coord[2])/3600
-            elif isinstance(coord, str):
-                parts = coord.split(',')
-                if len(parts) == 3:
-                    return float(parts[0]) + float(parts[1])/60 + float(parts[2])/3600
-            return float(coord)
-        
-        lat = convert_coord(latitude)
+        lat = dms_to_degrees(latitude)
         if str(lat_ref).upper() != 'N':
             lat = -lat
             
-        lon = convert_coord(longitude)
+        lon = dms_to_degrees(longitude)
         if str(long_ref).upper() != 'E':
             lon = -lon
             
@@ -80,105 +221,253 @@ def convert_gps_coordinates(gps_data):
     except (KeyError, TypeError, ValueError, IndexError) as e:
         return None, None
 
+# Dates are shown as "January 05, 2024 at 13:45:00" in every locale
+_MONTHS = ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+           'August', 'September', 'October', 'November', 'December')
+# EXIF's "YYYY:MM:DD HH:MM:SS" plus the common "-" and "/" date separators (never mixed)
+_EXIF_DATETIME_RE = re.compile(r'(\d{4})([:/-])(\d{2})\2(\d{2}) (\d{2}):(\d{2}):(\d{2})')
+_EXIF_DATETIME_FORMATS = ("%Y:%m:%d %H:%M:%S", "%Y-%m-%d %H:%M:%S", "%Y/%m/%d %H:%M:%S")
+
+def _format_display_time(year, month, day, hour, minute, second):
+    return f"{_MONTHS[month - 1]} {day:02d}, {year} at {hour:02d}:{minute:02d}:{second:02d}"
+
+def format_timestamp(timestamp):
+    """Formats a POSIX timestamp (e.g. from os.stat) as local time without building a datetime"""
+    t = time.localtime(timestamp)
+    return _format_display_time(t.tm_year, t.tm_mon, t.tm_mday, t.tm_hour, t.tm_min, t.tm_sec)
+
 def format_exif_time(time_str):
     """Formats EXIF datetime string into human-readable format with enhanced parsing"""
     try:
         # Handle various datetime formats
         time_str = str(time_str).strip()
-        for fmt in ("%Y:%m:%d %H:%M:%S", "%Y-%m-%d %H:%M:%S", "%Y/%m/%d %H:%M:%S"):
+        # Fast path: one regex match instead of up to three strptime calls
+        match = _EXIF_DATETIME_RE.fullmatch(time_str)
+        if match:
             try:
-                return datetime.strptime(time_str, fmt).strftime("%B %d, %Y at %H:%M:%S")
+                year, _, month, day, hour, minute, second = match.groups()
+                dt = datetime(*map(int, (year, month, day, hour, minute, second)))  # Validates day-of-month etc.
+            except ValueError:
+                pass
+            else:
+                return _format_display_time(dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second)
+        # Slow path for loosely formatted values such as single-digit fields
+        for fmt in _EXIF_DATETIME_FORMATS:
+            try:
+                dt = datetime.strptime(time_str, fmt)
             except ValueError:
                 continue
+            return _format_display_time(dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second)
         return time_str  # Return original if no format matched
     except (ValueError, TypeError):
         return str(time_str)
 
+def metadata_to_json(metadata):
+    """Serialize a metadata report as indented JSON text"""
+    if orjson is not None:
+        return orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                            default=str).decode('utf-8')
+    # Keep emoji keys as UTF-8 rather than \uXXXX surrogate-pair escapes
+    return json.dumps(metadata, indent=2, default=str, ensure_ascii=False)
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
 def get_human_readable_size(size_bytes):
     """Converts bytes to human-readable format with more precise units"""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB', 'PB']:
-        if size_bytes < 1024.0:
-            if unit == 'B':
-                return f"{size_bytes} {unit}"
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.2f} PB"
+    size_bytes = int(size_bytes)
+    if size_bytes < 1024:
+        return f"{size_bytes} B"
+    # floor(log2(size)) // 10 picks the unit without a division loop
+    unit = min(len(_SIZE_UNITS) - 1, (size_bytes.bit_length() - 1) // 10)
+    return f"{size_bytes / (1 << (unit * 10)):.2f} {_SIZE_UNITS[unit]}"
+
+# Phone brand patterns in priority order; each captures the model as its only group
+PHONE_BRAND_PATTERNS = (
+    ('iPhone', r'iPhone\s*([0-9]+[a-zA-Z]*)'),
+    ('iPad', r'iPad\s*([0-9]+[a-zA-Z]*)'),
+    ('Samsung', r'Samsung[-\s]*(Galaxy\s*[A-Za-z0-9]+)'),
+    ('Huawei', r'Huawei[-\s]*([A-Za-z0-9]+)'),
+    ('Xiaomi', r'Xiaomi[-\s]*(Mi\s*[A-Za-z0-9]+)'),
+    ('Google', r'Google[-\s]*(Pixel\s*[0-9]+)'),
+    ('OnePlus', r'OnePlus[-\s]*([0-9]+[A-Z]*)'),
+    ('Sony', r'Sony[-\s]*(Xperia\s*[A-Za-z0-9]+)'),
+    ('LG', r'LG[-\s]*([A-Za-z0-9]+)'),
+    ('Motorola', r'Moto[-\s]*([A-Za-z0-9]+)')
+)
+_PHONE_PATTERNS = [(brand, re.compile(pattern, re.IGNORECASE)) for brand, pattern in PHONE_BRAND_PATTERNS]
+_PHONE_BRAND_RANK = {brand: rank for rank, (brand, _) in enumerate(PHONE_BRAND_PATTERNS)}
+# All brands in one alternation: a single scan, and camera models match nothing
+_PHONE_ANY_PATTERN = re.compile('|'.join(f'(?P<{brand}>{pattern})' for brand, pattern in PHONE_BRAND_PATTERNS),
+                                re.IGNORECASE)
 
 def extract_phone_info(model_str):
     """Enhanced phone brand and model extraction with more brands and patterns"""
-    phone_db = {
-        'iPhone': r'iPhone\s*([0-9]+[a-zA-Z]*)',
-        'iPad': r'iPad\s*([0-9]+[a-zA-Z]*)',
-        'Samsung': r'Samsung[-\s]*(Galaxy\s*[A-Za-z0-9]+)',
-        'Huawei': r'Huawei[-\s]*([A-Za-z0-9]+)',
-        'Xiaomi': r'Xiaomi[-\s]*(Mi\s*[A-Za-z0-9]+)',
-        'Google': r'Google[-\s]*(Pixel\s*[0-9]+)',
-        'OnePlus': r'OnePlus[-\s]*([0-9]+[A-Z]*)',
-        'Sony': r'Sony[-\s]*(Xperia\s*[A-Za-z0-9]+)',
-        'LG': r'LG[-\s]*([A-Za-z0-9]+)',
-        'Motorola': r'Moto[-\s]*([A-Za-z0-9]+)'
-    }
-    
     model_str = str(model_str)
-    for brand, pattern in phone_db.items():
-        import re
-        match = re.search(pattern, model_str, re.IGNORECASE)
-        if match:
-            model = match.group(1) if match.groups() else model_str.replace(brand, '').strip()
-            return brand, model
-    return None, model_str
+    match = _PHONE_ANY_PATTERN.search(model_str)
+    if not match:
+        return None, model_str
+    
+    # The alternation finds the leftmost brand; a higher-priority brand matching
+    # further along still wins, so only those few patterns are re-checked
+    brand = match.lastgroup
+    for earlier_brand, pattern in _PHONE_PATTERNS[:_PHONE_BRAND_RANK[brand]]:
+        earlier_match = pattern.search(model_str)
+        if earlier_match:
+            return earlier_brand, earlier_match.group(1)
+    return brand, match.group(match.lastindex + 1)
 
-def extract_thumbnail(image_path):
-    """Extract embedded thumbnail if exists"""
+def extract_thumbnail(img):
+    """Return the embedded EXIF thumbnail directory (IFD1) of an open image, if any"""
     try:
-        with Image.open(image_path) as img:
-            if hasattr(img, 'thumbnail'):
-                return img.thumbnail
+        # Only JPEG/TIFF containers carry an IFD1 thumbnail; skip the rest early
+        if img.format not in ('JPEG', 'MPO', 'TIFF'):
             return None
+        thumbnail_ifd = img.getexif().get_ifd(_THUMBNAIL_IFD)
+        # JPEGInterchangeFormat (JPEG thumbnail) or StripOffsets (uncompressed)
+        if 0x0201 in thumbnail_ifd or 0x0111 in thumbnail_ifd:
+            return thumbnail_ifd
+        return None
+    except Exception:
+        return None
+
+# Steganography markers in priority order: (byte variants, finding)
+STEGANOGRAPHY_MARKERS = (
+    ((b'Photoshop',), "Potential Photoshop editing detected"),
+    ((b'Steg', b'steg'), "Possible steganography markers found"),
+    ((b'LSB', b'lsb'), "Possible LSB steganography indicators"),
+)
+
+def _build_marker_database():
+    """Compile all steganography markers into one Hyperscan database"""
+    if hyperscan is None:
+        return None
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[b'|'.join(re.escape(v) for v in variants) for variants, _ in STEGANOGRAPHY_MARKERS],
+            ids=list(range(len(STEGANOGRAPHY_MARKERS))),
+            elements=len(STEGANOGRAPHY_MARKERS),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(STEGANOGRAPHY_MARKERS)
+        )
+        return database
     except Exception:
         return None
 
-def analyze_steganography(image_path):
-    """Basic steganography detection (placeholder for real analysis)"""
+_MARKER_DATABASE = _build_marker_database()
+
+def _find_markers(content):
+    """Return the indices of STEGANOGRAPHY_MARKERS present in content"""
+    if _MARKER_DATABASE is not None and len(content):
+        found = set()
+        
+        def on_match(marker_id, start, end, flags, context):
+            found.add(marker_id)
+            return marker_id == 0  # Highest priority marker: stop scanning
+        
+        try:
+            _MARKER_DATABASE.scan(content, match_event_handler=on_match,
+                                  scratch=hyperscan.Scratch(_MARKER_DATABASE))
+        except hyperscan.ScanTerminated:
+            pass
+        return found
+    
+    # find() rather than `in`: mmap only supports single-byte membership tests
+    for index, (variants, _) in enumerate(STEGANOGRAPHY_MARKERS):
+        if any(content.find(v) != -1 for v in variants):
+            return {index}
+    return set()
+
+def analyze_steganography(source):
+    """Basic steganography detection (placeholder for real analysis)
+    
+    `source` is either a file path or an already mapped bytes/mmap buffer.
+    """
     try:
-        with open(image_path, 'rb') as f:
-            content = f.read()
-            if b'Photoshop' in content:
-                return "Potential Photoshop editing detected"
-            if b'Steg' in content or b'steg' in content:
-                return "Possible steganography markers found"
-            if b'LSB' in content or b'lsb' in content:
-                return "Possible LSB steganography indicators"
+        if isinstance(source, (str, os.PathLike)):
+            with open_mapped(source) as content:
+                return analyze_steganography(content)
+        
+        found = _find_markers(source)
+        if found:
+            return STEGANOGRAPHY_MARKERS[min(found)][1]
         return "No obvious steganography markers detected"
     except Exception:
         return "Steganography analysis failed"
 
-def detect_tampering_indicators(image_path):
-    """Detect potential image tampering indicators"""
+# ELA on images smaller than this (256x256) is dominated by noise
+ELA_MIN_PIXELS = 256 * 256
+
+@lru_cache(maxsize=None)
+def load_turbo_jpeg():
+    """Optional libjpeg-turbo codec for the ELA re-encode, loaded on first use"""
+    try:
+        from turbojpeg import TurboJPEG
+        return TurboJPEG()
+    except (ImportError, OSError, RuntimeError):
+        return None  # Package or native library missing
+
+def error_level_mean(source, image=None):
+    """Mean absolute difference between an image and its quality-90 JPEG re-encode
+    
+    `source` is either a file path or an already mapped bytes-like buffer.
+    Pass an already opened PIL `image` of the same data to avoid decoding it again.
+    Requires OpenCV; raises ImportError without it, and callers then skip ELA.
+    """
+    if image is None and isinstance(source, (str, os.PathLike)):
+        with open_mapped(source) as content:
+            return error_level_mean(content)
+    
+    import cv2
+    import numpy as np
+    
+    if image is not None:
+        original = cv2.cvtColor(np.asarray(image.convert('RGB')), cv2.COLOR_RGB2BGR)
+    else:
+        # Decode straight from the buffer (also copes with non-ASCII paths on Windows)
+        original = cv2.imdecode(np.frombuffer(source, np.uint8), cv2.IMREAD_COLOR)
+    turbo_jpeg = load_turbo_jpeg()
+    if turbo_jpeg is not None:
+        from turbojpeg import TJSAMP_420
+        # Same 4:2:0 chroma subsampling as OpenCV, so the verdict doesn't depend on the codec
+        recompressed = turbo_jpeg.decode(turbo_jpeg.encode(original, quality=90,
+                                                           jpeg_subsample=TJSAMP_420))
+    else:
+        recompressed = cv2.imencode('.jpg', original, [int(cv2.IMWRITE_JPEG_QUALITY), 90])[1]
+        recompressed = cv2.imdecode(recompressed, cv2.IMREAD_COLOR)
+    # One saturating uint8 pass instead of int16 temporaries
+    ela = cv2.absdiff(original, recompressed)
+    channels = ela.shape[2] if ela.ndim == 3 else 1
+    return sum(cv2.mean(ela)[:channels]) / channels
+
+def detect_tampering_indicators(source):
+    """Detect potential image tampering indicators
+    
+    `source` is a file path or a binary file object. Pillow reads it in small
+    chunks, so a mapping shared with the hashers is never copied as a whole.
+    """
     indicators = []
     try:
-        with Image.open(image_path) as img:
+        with Image.open(source) as img:
+            width, height = img.size
+            info = img.info
             # Check for multiple EXIF data blocks
-            if hasattr(img, 'info') and len(img.info) > 10:
+            if len(info) > 10:
                 indicators.append("Multiple metadata blocks detected")
             
             # Check for inconsistent compression
-            if 'compression' in img.info and img.info['compression'] not in ('jpeg', 'raw', None):
-                indicators.append(f"Unusual compression: {img.info['compression']}")
+            compression = info.get('compression')
+            if compression not in ('jpeg', 'raw', None):
+                indicators.append(f"Unusual compression: {compression}")
                 
-        # Check for error level analysis anomalies
-        try:
-            import numpy as np
-            import cv2
-            original = cv2.imread(image_path)
-            recompressed = cv2.imencode('.jpg', original, [int(cv2.IMWRITE_JPEG_QUALITY), 90])[1]
-            recompressed = cv2.imdecode(recompressed, 1)
-            ela = np.abs(original.astype(np.int16) - recompressed.astype(np.int16)).astype(np.uint8)
-            if np.mean(ela) > 15:
-                indicators.append("High Error Level Analysis (ELA) - Possible manipulation")
-        except:
-            pass
+            # Check for error level analysis anomalies (reusing the decoder opened above)
+            try:
+                if width * height >= ELA_MIN_PIXELS and error_level_mean(source, img) > 15:
+                    indicators.append("High Error Level Analysis (ELA) - Possible manipulation")
+            except Exception:
+                pass
             
+    except Image.UnidentifiedImageError:
+        indicators.append("Tampering detection error: cannot identify image file")
     except Exception as e:
         indicators.append(f"Tampering detection error: {str(e)}")
     
@@ -188,65 +477,260 @@ def detect_tampering_indicators(image_path):
 # 🔍 METADATA EXTRACTION
 # ======================
 
-def extract_all_metadata(image_path):
+# EXIF lookup tables, built once at import
+_EXIF_TAG_NAMES = ExifTags.TAGS
+
+# EXIF Flash tag values
+_FLASH_INFO = {
+    0x0: "No Flash",
+    0x1: "Fired",
+    0x5: "Fired, Return not detected",
+    0x7: "Fired, Return detected",
+    0x8: "On, Did not fire",
+    0x9: "On, Fired",
+    0xD: "On, Return not detected",
+    0xF: "On, Return detected",
+    0x10: "Off, Did not fire",
+    0x14: "Off, Did not fire, Return not detected",
+    0x18: "Auto, Did not fire",
+    0x19: "Auto, Fired",
+    0x1D: "Auto, Fired, Return not detected",
+    0x1F: "Auto, Fired, Return detected",
+    0x20: "No flash function",
+    0x30: "Off, No flash function",
+    0x41: "Fired, Red-eye reduction",
+    0x45: "Fired, Red-eye reduction, Return not detected",
+    0x47: "Fired, Red-eye reduction, Return detected",
+    0x49: "On, Red-eye reduction",
+    0x4D: "On, Red-eye reduction, Return not detected",
+    0x4F: "On, Red-eye reduction, Return detected",
+    0x50: "Off, Red-eye reduction",
+    0x58: "Auto, Did not fire, Red-eye reduction",
+    0x59: "Auto, Fired, Red-eye reduction",
+    0x5D: "Auto, Fired, Red-eye reduction, Return not detected",
+    0x5F: "Auto, Fired, Red-eye reduction, Return detected"
+}
+
+# Pointers from IFD0 to the sub-IFDs (ExifTags.IFD.Exif / ExifTags.IFD.GPSInfo)
+_EXIF_IFD = 0x8769
+_GPS_IFD = 0x8825
+_THUMBNAIL_IFD = -1  # ExifTags.IFD.IFD1
+
+# Readable names for enumerated EXIF values
+_ORIENTATION_LABELS = {
+    1: "Horizontal (normal)",
+    2: "Mirrored horizontal",
+    3: "Rotated 180",
+    4: "Mirrored vertical",
+    5: "Mirrored horizontal then rotated 90 CCW",
+    6: "Rotated 90 CW",
+    7: "Mirrored horizontal then rotated 90 CW",
+    8: "Rotated 90 CCW"
+}
+_LIGHT_SOURCE_LABELS = {
+    0: "Unknown", 1: "Daylight", 2: "Fluorescent", 3: "Tungsten (incandescent light)",
+    4: "Flash", 9: "Fine weather", 10: "Cloudy weather", 11: "Shade",
+    12: "Daylight fluorescent", 13: "Day white fluorescent", 14: "Cool white fluorescent",
+    15: "White fluorescent", 17: "Standard light A", 18: "Standard light B",
+    19: "Standard light C", 20: "D55", 21: "D65", 22: "D75", 23: "D50",
+    24: "ISO studio tungsten", 255: "Other light source"
+}
+_EXPOSURE_PROGRAM_LABELS = {
+    0: "Unidentified", 1: "Manual", 2: "Program Normal", 3: "Aperture Priority",
+    4: "Shutter Priority", 5: "Program Creative", 6: "Program Action",
+    7: "Portrait Mode", 8: "Landscape Mode"
+}
+_METERING_MODE_LABELS = {
+    0: "Unidentified", 1: "Average", 2: "CenterWeightedAverage", 3: "Spot",
+    4: "MultiSpot", 5: "Pattern", 6: "Partial", 255: "other"
+}
+_WHITE_BALANCE_LABELS = {0: "Auto", 1: "Manual"}
+_SCENE_TYPE_LABELS = {0: "Standard", 1: "Landscape", 2: "Portrait", 3: "Night"}
+_LEVEL_LABELS = {0: "Normal", 1: "Soft", 2: "Hard"}
+_SATURATION_LABELS = {0: "Normal", 1: "Low", 2: "High"}
+
+# EXIF tags worth surfacing: tag name -> (display name, value labels)
+_INTERESTING_EXIF_TAGS = {
+    'Orientation': ('Orientation', _ORIENTATION_LABELS),
+    'LightSource': ('Light Source', _LIGHT_SOURCE_LABELS),
+    'ExposureProgram': ('Exposure Program', _EXPOSURE_PROGRAM_LABELS),
+    'MeteringMode': ('Metering Mode', _METERING_MODE_LABELS),
+    'WhiteBalance': ('White Balance', _WHITE_BALANCE_LABELS),
+    'SceneCaptureType': ('Scene Type', _SCENE_TYPE_LABELS),
+    'LensModel': ('Lens Model', None),
+    'LensSerialNumber': ('Lens Serial', None),
+    'BodySerialNumber': ('Camera Serial', None),
+    'Contrast': ('Contrast', _LEVEL_LABELS),
+    'Saturation': ('Saturation', _SATURATION_LABELS),
+    'Sharpness': ('Sharpness', _LEVEL_LABELS),
+    'DigitalZoomRatio': ('Digital Zoom', None),
+    'ExposureBiasValue': ('Exposure Bias', None),
+    'MaxApertureValue': ('Max Aperture', None),
+    'SubjectDistance': ('Subject Distance', None),
+    'FocalLengthIn35mmFilm': ('35mm Equivalent Focal Length', None),
+}
+
+def _format_exposure_time(value):
+    if isinstance(value, tuple):
+        return f"{value[0]}/{value[1]} sec"
+    return f"{value} sec"
+
+def _rational_to_float(value):
+    if isinstance(value, tuple):
+        return value[0] / value[1]
+    return float(value)
+
+# Simple EXIF fields: (tag name, display name, formatter or None), in display order
+_DATE_FIELDS = (
+    ('DateTime', 'Capture Time', format_exif_time),
+    ('DateTimeOriginal', 'Original Capture Time', format_exif_time),
+    ('DateTimeDigitized', 'Digitization Time', format_exif_time),
+    ('SubSecTimeOriginal', 'Subsecond Time', None),
+)
+_CAMERA_FIELDS = (
+    ('Make', 'Manufacturer', None),
+    ('Model', 'Model', None),
+    ('Software', 'Software', None),
+    ('ExifVersion', 'EXIF Version', None),
+    ('BodySerialNumber', 'Camera Serial Number', None),
+    ('ExposureTime', 'Exposure Time', _format_exposure_time),
+    ('FNumber', 'Aperture', lambda value: f"f/{_rational_to_float(value):.1f}"),
+    ('ISOSpeedRatings', 'ISO Speed', None),
+    ('FocalLength', 'Focal Length', lambda value: f"{_rational_to_float(value):.1f} mm"),
+    ('Flash', 'Flash', lambda value: _FLASH_INFO.get(value, f"Unknown (Value: {value})")),
+)
+
+def collect_exif_fields(exif_data, fields):
+    """Format the tags of a field table that are present, falling back to str() on bad values"""
+    info = {}
+    for tag_name, display_name, formatter in fields:
+        if tag_name in exif_data:
+            value = exif_data[tag_name]
+            if formatter is not None:
+                try:
+                    value = formatter(value)
+                except Exception:
+                    value = str(value)
+            info[display_name] = value
+    return info
+
+def format_exif_value(value, labels=None):
+    """Render an EXIF value as text, naming enumerated values and reducing rationals"""
+    if labels is not None and isinstance(value, int) and value in labels:
+        return labels[value]
+    if hasattr(value, 'numerator') and hasattr(value, 'denominator') and not isinstance(value, int):
+        if not value.denominator:
+            return str(value.numerator)
+        ratio = Fraction(int(value.numerator), int(value.denominator))
+        return str(ratio.numerator) if ratio.denominator == 1 else f"{ratio.numerator}/{ratio.denominator}"
+    return str(value)
+
+@lru_cache(maxsize=None)
+def tool_information():
+    """Tool and host details for reports, looked up once per process
+    
+    platform.processor() may spawn `uname -p`, so it is not repeated per image.
+    """
+    return {
+        'Tool Name': 'AIM Forensic Extractor',
+        'Tool Version': 'v1.0',
+        'Tool Owner': 'Sabir Khan',
+        'Python Version': platform.python_version(),
+        'Operating System': platform.system(),
+        'OS Version': platform.version(),
+        'Processor': platform.processor()
+    }
+
+# Report sections, written by the extractor and read back by the GUI
+_K_FILE = '📁 File Information'
+_K_CAM = '📷 Camera Information'
+_K_GPS = '📍 GPS & Location Data'
+_K_INTEGRITY = '🔒 File Integrity'
+_K_FORENSIC = '🕵️‍♂️ Forensic Analysis'
+_K_WARN = '⚠️ Warnings'
+_K_ERR = '❌ Critical Error'
+_K_TRACE = '❌ Stack Trace'
+_K_EXTRA = '⚙️ Additional EXIF Data'
+
+# Placeholder shown until the GUI computes hashes on demand
+HASHES_NOT_COMPUTED = "Not computed yet (open the Forensic Analysis tab)"
+
+def extract_all_metadata(image_path, hash_algorithms=DEFAULT_HASH_ALGORITHMS, compute_hashes=True, image=None):
     """
     Enhanced metadata extraction with more forensic capabilities
+    Pass compute_hashes=False to skip the (slow) integrity hashes; they can be
+    filled in later with calculate_file_hashes().
+    Pass an already opened PIL `image` of the same file to avoid opening it again.
     Returns: Dictionary with categorized metadata
     """
     metadata = {
-        '⚠️ Warnings': [],
-        '🔒 File Integrity': {},
-        '🕵️‍♂️ Forensic Analysis': {}
+        _K_WARN: [],
+        _K_INTEGRITY: {},
+        _K_FORENSIC: {}
     }
     
     try:
-        # 🗃️ Enhanced file information with hashes
-        file_stats = os.stat(image_path)
-        metadata['📁 File Information'] = {
-            'File Name': os.path.basename(image_path),
-            'File Path': os.path.abspath(image_path),
-            'File Extension': os.path.splitext(image_path)[1].upper().replace('.', ''),
-            'File Size': get_human_readable_size(file_stats.st_size),
-            'Created': datetime.fromtimestamp(file_stats.st_ctime).strftime("%B %d, %Y at %H:%M:%S"),
-            'Modified': datetime.fromtimestamp(file_stats.st_mtime).strftime("%B %d, %Y at %H:%M:%S"),
-            'Accessed': datetime.fromtimestamp(file_stats.st_atime).strftime("%B %d, %Y at %H:%M:%S"),
-            'File Permissions': oct(file_stats.st_mode)[-3:],
-            'Inode Number': file_stats.st_ino,
-            'Device ID': file_stats.st_dev
-        }
-        
-        # 🔒 File hashes for forensic verification
-        metadata['🔒 File Integrity'] = calculate_file_hashes(image_path)
-        
-        # 🖼️ Open image and get basic properties
-        with Image.open(image_path) as img:
-            metadata['📁 File Information']['File Type'] = img.format
-            metadata['📁 File Information']['MIME Type'] = Image.MIME.get(img.format, "Unknown")
+        path = Path(image_path)
+        with open_mapped(path) as file_data, ThreadPoolExecutor(max_workers=1) as pool:
+            # ELA re-encodes the whole image; let it overlap hashing and EXIF parsing.
+            # It opens the path itself: wrapping the mapping in BytesIO would copy it.
+            tampering = pool.submit(detect_tampering_indicators, path)
             
-            # 📏 Enhanced image dimensions and quality
-            width, height = img.size
-            metadata['📐 Image Dimensions & Quality'] = {
-                'Width': f"{width} pixels",
-                'Height': f"{height} pixels",
-                'Megapixels': f"{(width * height) / 1000000:.2f} MP",
-                'Aspect Ratio': f"{width/height:.2f}:1",
-                'Color Mode': img.mode,
-                'Bit Depth': getattr(img, 'bits', 'Unknown'),
-                'Is Animated': getattr(img, 'is_animated', False),
-                'Has Transparency': 'Yes' if img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info) else 'No',
-                'Compression': img.info.get('compression', 'Unknown')
+            # 🗃️ Enhanced file information with hashes
+            file_stats = path.stat()
+            metadata[_K_FILE] = {
+                'File Name': path.name,
+                'File Path': os.path.abspath(path),  # Like resolve(), but keeps symlinks as given
+                'File Extension': path.suffix[1:].upper(),
+                'File Size': get_human_readable_size(file_stats.st_size),
+                'Created': format_timestamp(file_stats.st_ctime),
+                'Modified': format_timestamp(file_stats.st_mtime),
+                'Accessed': format_timestamp(file_stats.st_atime),
+                'File Permissions': oct(file_stats.st_mode)[-3:],
+                'Inode Number': file_stats.st_ino,
+                'Device ID': file_stats.st_dev
             }
+            fingerprint = quick_fingerprint(file_data)
+            if fingerprint:
+                metadata[_K_FILE]['Quick Fingerprint'] = fingerprint
+        
+            # 🔒 File hashes for forensic verification
+            if compute_hashes:
+                metadata[_K_INTEGRITY] = calculate_file_hashes(file_data, hash_algorithms, file_stats)
+            else:
+                metadata[_K_INTEGRITY] = HASHES_NOT_COMPUTED
+        
+            # 🖼️ Open image and get basic properties
+            with nullcontext(image) if image is not None else Image.open(path) as img:
+                metadata[_K_FILE]['File Type'] = img.format
+                metadata[_K_FILE]['MIME Type'] = Image.MIME.get(img.format, "Unknown")
+            
+                # 📏 Enhanced image dimensions and quality
+                width, height = img.size
+                metadata['📐 Image Dimensions & Quality'] = {
+                    'Width': f"{width} pixels",
+                    'Height': f"{height} pixels",
+                    'Megapixels': f"{(width * height) / 1000000:.2f} MP",
+                    'Aspect Ratio': f"{width/height:.2f}:1",
+                    'Color Mode': img.mode,
+                    'Bit Depth': getattr(img, 'bits', 'Unknown'),
+                    'Is Animated': getattr(img, 'is_animated', False),
+                    'Has Transparency': 'Yes' if img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info) else 'No',
+                    'Compression': img.info.get('compression', 'Unknown')
+                }
 
-            # 🕵️‍♂️ Enhanced forensic analysis
-            metadata['🕵️‍♂️ Forensic Analysis']['Thumbnail Present'] = 'Yes' if extract_thumbnail(image_path) else 'No'
-            metadata['🕵️‍♂️ Forensic Analysis']['Steganography Indicators'] = analyze_steganography(image_path)
-            metadata['🕵️‍♂️ Forensic Analysis']['Tampering Indicators'] = detect_tampering_indicators(image_path)
+                # 🕵️‍♂️ Enhanced forensic analysis
+                metadata[_K_FORENSIC]['Thumbnail Present'] = 'Yes' if extract_thumbnail(img) else 'No'
+                metadata[_K_FORENSIC]['Steganography Indicators'] = analyze_steganography(file_data)
+                metadata[_K_FORENSIC]['Tampering Indicators'] = tampering.result()
             
-            # 📷 Enhanced EXIF data extraction
-            exif_data = {}
-            if hasattr(img, '_getexif') and img._getexif() is not None:
-                for tag_id, value in img._getexif().items():
-                    tag_name = ExifTags.TAGS.get(tag_id, tag_id)
+                # 📷 Enhanced EXIF data extraction (single parse of IFD0 + Exif/GPS sub-IFDs)
+                exif_data = {}
+                exif = img.getexif()
+                for tag_id, value in list(exif.items()) + list(exif.get_ifd(_EXIF_IFD).items()):
+                    if tag_id in (_EXIF_IFD, _GPS_IFD):
+                        continue  # Sub-IFD offsets, not values
+                    tag_name = _EXIF_TAG_NAMES.get(tag_id, tag_id)
                     try:
                         # Handle different data types
                         if isinstance(value, bytes):
@@ -256,212 +740,467 @@ def extract_all_metadata(image_path):
                                 value = str(value)
                         exif_data[tag_name] = value
                     except Exception as e:
-                        metadata['⚠️ Warnings'].append(f"EXIF tag {tag_name} processing error: {str(e)}")
+                        metadata[_K_WARN].append(f"EXIF tag {tag_name} processing error: {str(e)}")
+                gps_ifd = exif.get_ifd(_GPS_IFD)
+                if gps_ifd:
+                    exif_data['GPSInfo'] = dict(gps_ifd)
 
-            # 📡 Enhanced GPS data processing
-            gps_info = {}
-            if 'GPSInfo' in exif_data:
-                try:
-                    gps_data = exif_data['GPSInfo']
-                    if isinstance(gps_data, dict):
-                        # Handle GPSInfo as dictionary (Pillow >= 6.0)
-                        gps_info_dict = gps_data
-                    else:
-                        # Handle GPSInfo as tuple (Pillow < 6.0)
-                        gps_info_dict = {
-                            1: gps_data[1],  # GPSLatitudeRef
-                            2: gps_data[2],  # GPSLatitude
-                            3: gps_data[3],  # GPSLongitudeRef
-                            4: gps_data[4],  # GPSLongitude
-                        }
-                        if len(gps_data) > 5:
-                            gps_info_dict[5] = gps_data[5]  # GPSAltitude
-                        if len(gps_data) > 6:
-                            gps_info_dict[6] = gps_data[6]  # GPSTimeStamp
-                        if len(gps_data) > 16:
-                            gps_info_dict[16] = gps_data[16]  # GPSImgDirection
+                # 📡 Enhanced GPS data processing
+                gps_info = {}
+                if 'GPSInfo' in exif_data:
+                    try:
+                        gps_data = exif_data['GPSInfo']
+                        if isinstance(gps_data, dict):
+                            # Handle GPSInfo as dictionary (Pillow >= 6.0)
+                            gps_info_dict = gps_data
+                        else:
+                            # Handle GPSInfo as tuple (Pillow < 6.0)
+                            gps_info_dict = {
+                                1: gps_data[1],  # GPSLatitudeRef
+                                2: gps_data[2],  # GPSLatitude
+                                3: gps_data[3],  # GPSLongitudeRef
+                                4: gps_data[4],  # GPSLongitude
+                            }
+                            if len(gps_data) > 5:
+                                gps_info_dict[5] = gps_data[5]  # GPSAltitude
+                            if len(gps_data) > 6:
+                                gps_info_dict[6] = gps_data[6]  # GPSTimeStamp
+                            if len(gps_data) > 16:
+                                gps_info_dict[16] = gps_data[16]  # GPSImgDirection
                     
-                    lat, lon = convert_gps_coordinates({
-                        'GPSLatitude': gps_info_dict.get(2),
-                        'GPSLatitudeRef': gps_info_dict.get(1),
-                        'GPSLongitude': gps_info_dict.get(4),
-                        'GPSLongitudeRef': gps_info_dict.get(3)
-                    })
+                        lat, lon = convert_gps_coordinates({
+                            'GPSLatitude': gps_info_dict.get(2),
+                            'GPSLatitudeRef': gps_info_dict.get(1),
+                            'GPSLongitude': gps_info_dict.get(4),
+                            'GPSLongitudeRef': gps_info_dict.get(3)
+                        })
                     
-                    if lat is not None and lon is not None:
-                        gps_info['Latitude'] = f"{lat:.6f}°"
-                        gps_info['Longitude'] = f"{lon:.6f}°"
-                        gps_info['Google Maps Link'] = f"https://maps.google.com/?q={lat},{lon}"
-                        gps_info['OpenStreetMap Link'] = f"https://www.openstreetmap.org/?mlat={lat}&mlon={lon}"
+                        if lat is not None and lon is not None:
+                            gps_info['Latitude'] = f"{lat:.6f}°"
+                            gps_info['Longitude'] = f"{lon:.6f}°"
+                            gps_info['Google Maps Link'] = f"https://maps.google.com/?q={lat},{lon}"
+                            gps_info['OpenStreetMap Link'] = f"https://www.openstreetmap.org/?mlat={lat}&mlon={lon}"
                         
-                        if 5 in gps_info_dict:  # Altitude
-                            gps_info['Altitude'] = f"{gps_info_dict[5]} meters"
-                        if 6 in gps_info_dict:  # Timestamp
-                            gps_info['GPS Timestamp'] = str(gps_info_dict[6])
-                        if 16 in gps_info_dict:  # Direction
-                            gps_info['Direction'] = f"{gps_info_dict[16]}°"
-                except Exception as e:
-                    metadata['⚠️ Warnings'].append(f"GPS data processing error: {str(e)}")
-            
-            metadata['📍 GPS & Location Data'] = gps_info if gps_info else "No GPS data found"
-
-            # 📅 Enhanced Date/Time information
-            date_info = {}
-            if 'DateTime' in exif_data:
-                date_info['Capture Time'] = format_exif_time(exif_data['DateTime'])
-            if 'DateTimeOriginal' in exif_data:
-                date_info['Original Capture Time'] = format_exif_time(exif_data['DateTimeOriginal'])
-            if 'DateTimeDigitized' in exif_data:
-                date_info['Digitization Time'] = format_exif_time(exif_data['DateTimeDigitized'])
-            if 'SubSecTimeOriginal' in exif_data:
-                date_info['Subsecond Time'] = exif_data['SubSecTimeOriginal']
-            
-            metadata['🕒 Date & Time Information'] = date_info if date_info else "No date/time metadata found"
-
-            # 📷 Enhanced Camera information
-            camera_info = {}
-            if 'Make' in exif_data:
-                camera_info['Manufacturer'] = exif_data['Make']
-            if 'Model' in exif_data:
-                camera_info['Model'] = exif_data['Model']
-                # Check if this might be a phone
-                phone_brand, phone_model = extract_phone_info(exif_data['Model'])
-                if phone_brand:
-                    metadata['📱 Device Information'] = {
-                        'Device Type': 'Smartphone',
-                        'Brand': phone_brand,
-                        'Model': phone_model,
-                        'Operating System': 'Unknown'
-                    }
-                    # Try to detect OS based on brand
-                    if phone_brand.lower() in ('iphone', 'ipad'):
-                        metadata['📱 Device Information']['Operating System'] = 'iOS'
-                    elif phone_brand.lower() in ('samsung', 'huawei', 'xiaomi', 'google', 'oneplus', 'sony', 'lg', 'motorola'):
-                        metadata['📱 Device Information']['Operating System'] = 'Android'
-            if 'Software' in exif_data:
-                camera_info['Software'] = exif_data['Software']
-            if 'ExifVersion' in exif_data:
-                camera_info['EXIF Version'] = exif_data['ExifVersion'].decode('ascii') if isinstance(exif_data['ExifVersion'], bytes) else exif_data['ExifVersion']
-            if 'BodySerialNumber' in exif_data:
-                camera_info['Camera Serial Number'] = exif_data['BodySerialNumber']
-            
-            # 🎚️ Enhanced Camera settings
-            camera_settings = {}
-            if 'ExposureTime' in exif_data:
-                try:
-                    if isinstance(exif_data['ExposureTime'], tuple):
-                        camera_settings['Exposure Time'] = f"{exif_data['ExposureTime'][0]}/{exif_data['ExposureTime'][1]} sec"
-                    else:
-                        camera_settings['Exposure Time'] = f"{exif_data['ExposureTime']} sec"
-                except:
-                    camera_settings['Exposure Time'] = str(exif_data['ExposureTime'])
-            if 'FNumber' in exif_data:
-                try:
-                    if isinstance(exif_data['FNumber'], tuple):
-                        camera_settings['Aperture'] = f"f/{exif_data['FNumber'][0]/exif_data['FNumber'][1]:.1f}"
-                    else:
-                        camera_settings['Aperture'] = f"f/{float(exif_data['FNumber']):.1f}"
-                except:
-                    camera_settings['Aperture'] = str(exif_data['FNumber'])
-            if 'ISOSpeedRatings' in exif_data:
-                camera_settings['ISO Speed'] = exif_data['ISOSpeedRatings']
-            if 'FocalLength' in exif_data:
-                try:
-                    if isinstance(exif_data['FocalLength'], tuple):
-                        camera_settings['Focal Length'] = f"{exif_data['FocalLength'][0]/exif_data['FocalLength'][1]:.1f} mm"
-                    else:
-                        camera_settings['Focal Length'] = f"{float(exif_data['FocalLength']):.1f} mm"
-                except:
-                    camera_settings['Focal Length'] = str(exif_data['FocalLength'])
-            if 'Flash' in exif_data:
-                flash_info = {
-                    0x0: "No Flash",
-                    0x1: "Fired",
-                    0x5: "Fired, Return not detected",
-                    0x7: "Fired, Return detected",
-                    0x8: "On, Did not fire",
-                    0x9: "On, Fired",
-                    0xD: "On, Return not detected",
-                    0xF: "On, Return detected",
-                    0x10: "Off, Did not fire",
-                    0x14: "Off, Did not fire, Return not detected",
-                    0x18: "Auto, Did not fire",
-                    0x19: "Auto, Fired",
-                    0x1D: "Auto, Fired, Return not detected",
-                    0x1F: "Auto, Fired, Return detected",
-                    0x20: "No flash function",
-                    0x30: "Off, No flash function",
-                    0x41: "Fired, Red-eye reduction",
-                    0x45: "Fired, Red-eye reduction, Return not detected",
-                    0x47: "Fired, Red-eye reduction, Return detected",
-                    0x49: "On, Red-eye reduction",
-                    0x4D: "On, Red-eye reduction, Return not detected",
-                    0x4F: "On, Red-eye reduction, Return detected",
-                    0x50: "Off, Red-eye reduction",
-                    0x58: "Auto, Did not fire, Red-eye reduction",
-                    0x59: "Auto, Fired, Red-eye reduction",
-                    0x5D: "Auto, Fired, Red-eye reduction, Return not detected",
-                    0x5F: "Auto, Fired, Red-eye reduction, Return detected"
-                }
-                camera_settings['Flash'] = flash_info.get(exif_data['Flash'], f"Unknown (Value: {exif_data['Flash']})")
+                            if 5 in gps_info_dict:  # Altitude
+                                gps_info['Altitude'] = f"{gps_info_dict[5]} meters"
+                            if 6 in gps_info_dict:  # Timestamp
+                                gps_info['GPS Timestamp'] = str(gps_info_dict[6])
+                            if 16 in gps_info_dict:  # Direction
+                                gps_info['Direction'] = f"{gps_info_dict[16]}°"
+                    except Exception as e:
+                        metadata[_K_WARN].append(f"GPS data processing error: {str(e)}")
             
-            metadata['📷 Camera Information'] = {**camera_info, **camera_settings} if camera_info or camera_settings else "No camera metadata found"
+                metadata[_K_GPS] = gps_info if gps_info else "No GPS data found"
 
-        # 🔍 Enhanced EXIF extraction with exifread
-        with open(image_path, 'rb') as f:
-            tags = exifread.process_file(f, details=False)
-            
-            # ✨ Additional interesting metadata
-            interesting_tags = {
-                'Image Orientation': 'Orientation',
-                'EXIF LightSource': 'Light Source',
-                'EXIF ExposureProgram': 'Exposure Program',
-                'EXIF MeteringMode': 'Metering Mode',
-                'EXIF WhiteBalance': 'White Balance',
-                'EXIF SceneCaptureType': 'Scene Type',
-                'EXIF LensModel': 'Lens Model',
-                'EXIF LensSerialNumber': 'Lens Serial',
-                'EXIF BodySerialNumber': 'Camera Serial',
-                'EXIF Contrast': 'Contrast',
-                'EXIF Saturation': 'Saturation',
-                'EXIF Sharpness': 'Sharpness',
-                'EXIF DigitalZoomRatio': 'Digital Zoom',
-                'EXIF ExposureBiasValue': 'Exposure Bias',
-                'EXIF MaxApertureValue': 'Max Aperture',
-                'EXIF SubjectDistance': 'Subject Distance',
-                'EXIF FocalLengthIn35mmFilm': '35mm Equivalent Focal Length',
-            }
-            
-            additional_data = {}
-            for exif_key, display_name in interesting_tags.items():
-                if exif_key in tags:
-                    additional_data[display_name] = str(tags[exif_key])
+                # 📅 Enhanced Date/Time information
+                date_info = collect_exif_fields(exif_data, _DATE_FIELDS)
+                metadata['🕒 Date & Time Information'] = date_info if date_info else "No date/time metadata found"
+
+                # 📷 Enhanced Camera information and settings
+                camera_info = collect_exif_fields(exif_data, _CAMERA_FIELDS)
+                if 'Model' in exif_data:
+                    # Check if this might be a phone
+                    phone_brand, phone_model = extract_phone_info(exif_data['Model'])
+                    if phone_brand:
+                        metadata['📱 Device Information'] = {
+                            'Device Type': 'Smartphone',
+                            'Brand': phone_brand,
+                            'Model': phone_model,
+                            'Operating System': 'Unknown'
+                        }
+                        # Try to detect OS based on brand
+                        if phone_brand.lower() in ('iphone', 'ipad'):
+                            metadata['📱 Device Information']['Operating System'] = 'iOS'
+                        elif phone_brand.lower() in ('samsung', 'huawei', 'xiaomi', 'google', 'oneplus', 'sony', 'lg', 'motorola'):
+                            metadata['📱 Device Information']['Operating System'] = 'Android'
             
-            if additional_data:
-                metadata['⚙️ Additional EXIF Data'] = additional_data
-
-        # 🕵️‍♂️ Add system information
-        metadata['💻 Tool Information'] = {
-            'Tool Name': 'AIM Forensic Extractor',
-            'Tool Version': 'v1.0',
-            'Tool Owner': 'Sabir Khan',
-            'Python Version': platform.python_version(),
-            'Operating System': platform.system(),
-            'OS Version': platform.version(),
-            'Processor': platform.processor()
-        }
+                metadata[_K_CAM] = camera_info if camera_info else "No camera metadata found"
+
+                # ✨ Additional interesting metadata
+                additional_data = {}
+                for tag_name, (display_name, labels) in _INTERESTING_EXIF_TAGS.items():
+                    if tag_name in exif_data:
+                        additional_data[display_name] = format_exif_value(exif_data[tag_name], labels)
+                
+                if additional_data:
+                    metadata[_K_EXTRA] = additional_data
+
+            # 🕵️‍♂️ Add system information
+            metadata['💻 Tool Information'] = dict(tool_information())
 
     except Exception as e:
-        metadata['❌ Critical Error'] = f"Failed to process image: {str(e)}"
+        metadata[_K_ERR] = f"Failed to process image: {str(e)}"
         import traceback
-        metadata['❌ Stack Trace'] = traceback.format_exc()
+        metadata[_K_TRACE] = traceback.format_exc()
     
     return metadata
 
+# ======================
+# 📦 BATCH PROCESSING
+# ======================
+
+# Extensions picked up when a directory is passed to batch mode
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.tiff', '.tif', '.bmp', '.gif', '.heic', '.webp', '.raw')
+
+def collect_image_paths(paths):
+    """Expand directories into the image files they contain (recursively)"""
+    image_paths = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                image_paths.extend(os.path.join(root, name) for name in sorted(files)
+                                   if name.lower().endswith(IMAGE_EXTENSIONS))
+        elif os.path.exists(path):
+            image_paths.append(path)
+    return image_paths
+
+def extract_batch(paths, workers=None, hash_algorithms=DEFAULT_HASH_ALGORITHMS):
+    """
+    Extract metadata for many images in parallel worker processes
+    Returns: Dictionary mapping each path to its metadata, in input order
+    """
+    from concurrent.futures import ProcessPoolExecutor  # Pulls in multiprocessing; batch mode only
+    
+    paths = list(paths)
+    if not paths:
+        return {}
+    
+    workers = workers or os.cpu_count() or 1
+    # Hand out several files per task to amortize IPC, but keep every worker busy
+    chunksize = max(1, min(16, len(paths) // (workers * 4)))
+    extract = partial(extract_all_metadata, hash_algorithms=tuple(hash_algorithms))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(paths, executor.map(extract, paths, chunksize=chunksize)))
+
+def write_batch_reports(results, output_dir):
+    """Write one <name>_metadata.json per image and return the written paths"""
+    os.makedirs(output_dir, exist_ok=True)
+    written = []
+    used_names = set()
+    for image_path, metadata in results.items():
+        stem = Path(image_path).stem
+        name = f"{stem}_metadata.json"
+        counter = 2
+        while name in used_names:  # Same file name in different folders
+            name = f"{stem}_{counter}_metadata.json"
+            counter += 1
+        used_names.add(name)
+        
+        report_path = os.path.join(output_dir, name)
+        with open(report_path, 'w', encoding='utf-8') as f:
+            f.write(metadata_to_json(metadata))
+        written.append(report_path)
+    return written
+
+# ======================
+# 🧵 BACKGROUND WORKERS
+# ======================
+
+def pil_to_qimage(img):
+    """Convert a PIL image to a standalone QImage (safe to build off the GUI thread)"""
+    try:
+        if img.mode == 'RGB':
+            channels, image_format = 3, QImage.Format_RGB888
+        else:
+            img = img.convert('RGBA')
+            channels, image_format = 4, QImage.Format_RGBA8888
+        width, height = img.size
+        # copy() detaches the QImage from the temporary byte string
+        return QImage(img.tobytes(), width, height, width * channels, image_format).copy()
+    except Exception:
+        return QImage()
+
+# Recently analyzed images, so flipping back to a file skips re-extraction.
+# Keyed by (absolute path, mtime_ns, size, extraction options); LRU order.
+_META_CACHE = OrderedDict()
+_META_CACHE_SIZE = 64
+_META_CACHE_LOCK = threading.Lock()
+
+def _metadata_cache_key(image_path, options):
+    try:
+        st = os.stat(image_path)
+    except OSError:
+        return None
+    return (os.path.abspath(image_path), st.st_mtime_ns, st.st_size, tuple(sorted(options.items())))
+
+def get_cached_metadata(key):
+    """Return a private copy of cached metadata for a cache key (None on a miss)"""
+    with _META_CACHE_LOCK:
+        metadata = _META_CACHE.get(key)
+        if metadata is None:
+            return None
+        _META_CACHE.move_to_end(key)
+    # Callers fill in hashes later; that must not leak back into the cache
+    return copy.deepcopy(metadata)
+
+def store_cached_metadata(key, metadata):
+    """Remember a copy of metadata, evicting the least recently used entries"""
+    metadata = copy.deepcopy(metadata)
+    with _META_CACHE_LOCK:
+        _META_CACHE[key] = metadata
+        _META_CACHE.move_to_end(key)
+        while len(_META_CACHE) > _META_CACHE_SIZE:
+            _META_CACHE.popitem(last=False)
+
+class WorkerSignals(QObject):
+    """Signals emitted by background workers (QRunnable is not a QObject)"""
+    progress = pyqtSignal(int)
+    preview = pyqtSignal(str, QImage)  # image path, decoded preview (null if unsupported)
+    finished = pyqtSignal(str, object)  # image path, metadata
+    error = pyqtSignal(str, str)  # image path, message
+
+class MetadataWorker(QRunnable):
+    """Runs extract_all_metadata on the thread pool so the GUI stays responsive"""
+    
+    def __init__(self, image_path, preview_size=None, **options):
+        super().__init__()
+        self.image_path = image_path
+        self.preview_size = preview_size  # (width, height) bound for the preview
+        self.options = options
+        self.signals = WorkerSignals()
+    
+    def run(self):
+        img = None
+        try:
+            # Open the file once: the same PIL image feeds the preview and the EXIF parse
+            try:
+                img = Image.open(self.image_path)
+            except Exception:
+                pass  # extract_all_metadata reports the failure in the metadata
+            cache_key = _metadata_cache_key(self.image_path, self.options)
+            metadata = get_cached_metadata(cache_key) if cache_key else None
+            if metadata is None:
+                metadata = extract_all_metadata(self.image_path, image=img, **self.options)
+                if cache_key and _K_ERR not in metadata:
+                    store_cached_metadata(cache_key, metadata)
+            self.signals.progress.emit(50)
+            
+            # Decode the preview last: draft()/thumbnail() shrink the image in place
+            self.signals.preview.emit(self.image_path, self.decode_preview(img) if img else QImage())
+            self.signals.progress.emit(80)
+        except Exception as e:
+            self.signals.error.emit(self.image_path, str(e))
+        else:
+            self.signals.finished.emit(self.image_path, metadata)
+        finally:
+            if img is not None:
+                img.close()
+    
+    def decode_preview(self, img):
+        """Decode a preview no larger than needed (JPEGs decode at 1/2-1/8 scale)"""
+        try:
+            if self.preview_size:
+                img.draft('RGB', self.preview_size)
+                img.thumbnail(self.preview_size, Image.BILINEAR)
+        except Exception:
+            pass  # Fall back to the full-size decode
+        return pil_to_qimage(img)
+
+class HashWorker(QRunnable):
+    """Computes the integrity hashes of a file on the thread pool"""
+    
+    def __init__(self, image_path, algorithms):
+        super().__init__()
+        self.image_path = image_path
+        self.algorithms = algorithms
+        self.signals = WorkerSignals()
+    
+    def run(self):
+        try:
+            hashes = calculate_file_hashes(self.image_path, self.algorithms)
+        except Exception as e:
+            self.signals.error.emit(self.image_path, str(e))
+        else:
+            self.signals.finished.emit(self.image_path, hashes)
+
 # ======================
 # 🖥️ GUI APPLICATION
 # ======================
 
+# Professional dark theme, set on the main window (unparented file dialogs keep the native look)
+APP_STYLESHEET = """
+    QMainWindow {
+        background-color: #1e1e2d;
+    }
+    QGroupBox {
+        border: 2px solid #3a3a4a;
+        border-radius: 8px;
+        margin-top: 15px;
+        padding-top: 20px;
+        color: #e0e0e0;
+        font-weight: bold;
+        font-size: 14px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 15px;
+        padding: 0 5px;
+    }
+    QLabel {
+        color: #e0e0e0;
+        font-size: 13px;
+    }
+    QPushButton {
+        background-color: #3a3a4a;
+        color: #ffffff;
+        border: 1px solid #4a4a5a;
+        padding: 10px 20px;
+        border-radius: 6px;
+        font-weight: bold;
+        font-size: 13px;
+        min-width: 120px;
+    }
+    QPushButton:hover {
+        background-color: #4a4a5a;
+        border: 1px solid #5a5a6a;
+    }
+    QPushButton:pressed {
+        background-color: #2a2a3a;
+    }
+    QTreeWidget {
+        background-color: #2a2a3a;
+        color: #e0e0e0;
+        border: 1px solid #3a3a4a;
+        font-family: 'Fira Code', Consolas, monospace;
+        font-size: 12px;
+    }
+    QTreeWidget::item {
+        color: #e0e0e0;
+        padding: 6px;
+        border-bottom: 1px solid #3a3a4a;
+    }
+    QHeaderView::section {
+        background-color: #2a2a3a;
+        color: #ffffff;
+        padding: 8px;
+        border: none;
+        font-weight: bold;
+        font-size: 13px;
+    }
+    QTextEdit, QPlainTextEdit {
+        background-color: #2a2a3a;
+        color: #e0e0e0;
+        border: 1px solid #3a3a4a;
+        font-family: 'Fira Code', Consolas, monospace;
+        font-size: 12px;
+    }
+    QCheckBox {
+        color: #e0e0e0;
+        font-size: 13px;
+    }
+    QProgressBar {
+        border: 1px solid #3a3a4a;
+        border-radius: 4px;
+        text-align: center;
+        color: white;
+        background-color: #252535;
+    }
+    QProgressBar::chunk {
+        background-color: #4CAF50;
+        width: 10px;
+        border-radius: 3px;
+    }
+    QTabBar {
+        background-color: #2a2a3a;
+        border-bottom: 1px solid #3a3a4a;
+    }
+    
+    QTabBar::tab {
+        background: #2a2a3a;
+        color: #b0b0b0;
+        padding: 8px 15px;
+        margin: 0;
+        border: 1px solid #3a3a4a;
+        border-bottom: none;
+        border-top-left-radius: 5px;
+        border-top-right-radius: 5px;
+        margin-right: 2px;
+        font-weight: bold;
+        min-width: 120px;
+    }
+    
+    QTabBar::tab:selected {
+        background: #3a3a4a;
+        color: #ffffff;
+        border-bottom: 2px solid #4CAF50;
+    }
+    
+    QTabBar::tab:hover {
+        background: #3a3a5a;
+    }
+    
+    QTabBar::tab:!selected {
+        margin-top: 2px; /* make non-selected tabs look smaller */
+    }
+    
+    QTabWidget::pane {
+        border: 1px solid #3a3a4a;
+        background: #2a2a3a;
+        position: absolute;
+        top: -1px;
+    }
+    
+    QTabWidget::tab-bar {
+        alignment: center;
+    }
+    
+    QStatusBar {
+        background-color: #252535;
+        color: #b0b0b0;
+        border-top: 1px solid #3a3a4a;
+        font-size: 12px;
+    }
+    
+    QLabel#titleLabel {
+        font-size: 16px;
+        font-weight: bold;
+    }
+    
+    QLabel#subtitleLabel {
+        color: #b0b0b0;
+    }
+    
+    QLabel#imageLabel {
+        background-color: #252535; 
+        border: 2px solid #3a3a4a;
+        border-radius: 5px;
+    }
+    
+    QLabel#imageInfoLabel {
+        font-size: 12px;
+        color: #b0b0b0;
+    }
+    
+    QTextEdit#forensicSummary {
+        font-size: 12px;
+    }
+"""
+
+# Name filter for the Open Image dialog
+IMAGE_FILE_FILTER = "Image files (" + " ".join(f"*{ext}" for ext in IMAGE_EXTENSIONS) + ")"
+
+# Title block at the top of every TXT export
+TXT_REPORT_BANNER = ("="*80 + "\n"
+                     + "IMAGE METADATA FORENSIC REPORT\n".center(80) + "\n"
+                     + "="*80 + "\n\n")
+
+def open_folder(path):
+    """Show a folder in the platform file manager (Explorer, Finder, xdg-open)"""
+    QDesktopServices.openUrl(QUrl.fromLocalFile(path))
+
+@contextmanager
+def updates_suspended(*widgets):
+    """Disable painting of widgets while they are refilled, restoring the previous state"""
+    previous = [widget.updatesEnabled() for widget in widgets]
+    for widget in widgets:
+        widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        for widget, enabled in zip(widgets, previous):
+            widget.setUpdatesEnabled(enabled)
+
 class MetadataExtractorApp(QMainWindow):
     
     def __init__(self):
@@ -474,147 +1213,7 @@ class MetadataExtractorApp(QMainWindow):
         self.load_fonts()
         
         # Set application style with professional dark theme
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #1e1e2d;
-            }
-            QGroupBox {
-                border: 2px solid #3a3a4a;
-                border-radius: 8px;
-                margin-top: 15px;
-                padding-top: 20px;
-                color: #e0e0e0;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 15px;
-                padding: 0 5px;
-            }
-            QLabel {
-                color: #e0e0e0;
-                font-size: 13px;
-            }
-            QPushButton {
-                background-color: #3a3a4a;
-                color: #ffffff;
-                border: 1px solid #4a4a5a;
-                padding: 10px 20px;
-                border-radius: 6px;
-                font-weight: bold;
-                font-size: 13px;
-                min-width: 120px;
-            }
-            QPushButton:hover {
-                background-color: #4a4a5a;
-                border: 1px solid #5a5a6a;
-            }
-            QPushButton:pressed {
-                background-color: #2a2a3a;
-            }
-            QTreeWidget {
-                background-color: #2a2a3a;
-                color: #e0e0e0;
-                border: 1px solid #3a3a4a;
-                font-family: 'Fira Code', Consolas, monospace;
-                font-size: 12px;
-                alternate-background-color: #252535;
-            }
-            QTreeWidget::item {
-                color: #e0e0e0;
-                padding: 6px;
-                border-bottom: 1px solid #3a3a4a;
-            }
-            QTreeWidget::item:hover {
-                background-color: #3a3a5a;
-            }
-            QHeaderView::section {
-                background-color: #2a2a3a;
-                color: #ffffff;
-                padding: 8px;
-                border: none;
-                font-weight: bold;
-                font-size: 13px;
-            }
-            QTextEdit {
-                background-color: #2a2a3a;
-                color: #e0e0e0;
-                border: 1px solid #3a3a4a;
-                font-family: 'Fira Code', Consolas, monospace;
-                font-size: 12px;
-            }
-            QProgressBar {
-                border: 1px solid #3a3a4a;
-                border-radius: 4px;
-                text-align: center;
-                color: white;
-                background-color: #252535;
-            }
-            QProgressBar::chunk {
-                background-color: #4CAF50;
-                width: 10px;
-                border-radius: 3px;
-            }
-            QTabWidget::pane {
-                border: 1px solid #3a3a4a;
-                background: #2a2a3a;
-            }
-            QTabBar::tab {
-                background: #2a2a3a;
-                color: #b0b0b0;
-                padding: 10px 20px;
-                border: 1px solid #3a3a4a;
-                border-bottom: none;
-                border-top-left-radius: 5px;
-                border-top-right-radius: 5px;
-                margin-right: 2px;
-                font-weight: bold;
-            }
-            QTabBar {
-                background-color: #2a2a3a;
-                border-bottom: 1px solid #3a3a4a;
-            }
-            
-            QTabBar::tab {
-                background: #2a2a3a;
-                color: #b0b0b0;
-                padding: 8px 15px;
-                margin: 0;
-                border: 1px solid #3a3a4a;
-                border-bottom: none;
-                border-top-left-radius: 5px;
-                border-top-right-radius: 5px;
-                margin-right: 2px;
-                font-weight: bold;
-                min-width: 120px;
-            }
-            
-            QTabBar::tab:selected {
-                background: #3a3a4a;
-                color: #ffffff;
-                border-bottom: 2px solid #4CAF50;
-            }
-            
-            QTabBar::tab:hover {
-                background: #3a3a5a;
-            }
-            
-            QTabBar::tab:!selected {
-                margin-top: 2px; /* make non-selected tabs look smaller */
-            }
-            
-            QTabWidget::pane {
-                border: 1px solid #3a3a4a;
-                background: #2a2a3a;
-                position: absolute;
-                top: -1px;
-            }
-            
-            QTabWidget::tab-bar {
-                alignment: center;
-            }
-        """)
+        self.setStyleSheet(APP_STYLESHEET)
         
         # Central widget and layout
         self.central_widget = QWidget()
@@ -631,24 +1230,36 @@ class MetadataExtractorApp(QMainWindow):
         
         # Status bar
         self.status_bar = self.statusBar()
-        self.status_bar.setStyleSheet("""
-            QStatusBar {
-                background-color: #252535;
-                color: #b0b0b0;
-                border-top: 1px solid #3a3a4a;
-                font-size: 12px;
-            }
-        """)
         self.status_bar.showMessage("Ready to analyze images")
         
         # Initialize variables
         self.current_file = None
         self.metadata = None
-        
-        # Start animation timer
+        self.metadata_json = None
+        self.hash_job = None  # (path, algorithms) being hashed in the background
+        self.pending_reports = []  # save_report/export_to_txt waiting on the hashes
+        self.file_dialogs = {}  # Created on first use, see get_file_dialog()
+        self.export_header = ""
+        self.forensic_text = ""
+        self.stale_tabs = set()  # Metadata tabs to refill when next shown
+        
+        # Own pool for analysis workers: Qt's smooth image scaling runs on the
+        # global pool, and a GIL-holding GUI thread waiting on it would deadlock
+        # if our workers occupied every global thread
+        self.thread_pool = QThreadPool(self)
+        
+        # Preview decoded once per image and rescaled after resizing stops
+        self.preview_pixmap = QPixmap()
+        self.preview_resize_timer = QTimer(self)
+        self.preview_resize_timer.setSingleShot(True)
+        self.preview_resize_timer.setInterval(80)
+        self.preview_resize_timer.timeout.connect(self.apply_scaled_preview)
+        
+        # Title animation timer; only runs while the window is visible, active and idle
         self.animation_timer = QTimer(self)
+        self.animation_timer.setInterval(50)
         self.animation_timer.timeout.connect(self.update_animations)
-        self.animation_timer.start(50)
+        self.analysis_running = False
         
         # Animation variables
         self.animation_phase = 0
@@ -659,6 +1270,20 @@ class MetadataExtractorApp(QMainWindow):
             QColor(255, 193, 7),   # Amber
             QColor(244, 67, 54)    # Red
         ]
+        # Title color for every animation phase, blended once instead of per tick;
+        # size and weight come from the QLabel#titleLabel rule
+        self.title_styles = []
+        for phase in range(360):
+            position = (phase / 360) * len(self.animation_colors)
+            color_index = int(position)
+            progress = position % 1
+            current_color = self.animation_colors[color_index]
+            next_color = self.animation_colors[(color_index + 1) % len(self.animation_colors)]
+            
+            r = int(current_color.red() + (next_color.red() - current_color.red()) * progress)
+            g = int(current_color.green() + (next_color.green() - current_color.green()) * progress)
+            b = int(current_color.blue() + (next_color.blue() - current_color.blue()) * progress)
+            self.title_styles.append(f"color: rgb({r}, {g}, {b});")
     
     def load_fonts(self):
         """Load custom fonts for the application"""
@@ -674,12 +1299,12 @@ class MetadataExtractorApp(QMainWindow):
         except:
             self.mono_font = QFont("Consolas", 10)
         
-        self.title_font = QFont()
-        self.title_font.setBold(True)
-        self.title_font.setPointSize(16)
-        
         self.subtitle_font = QFont()
         self.subtitle_font.setPointSize(12)
+        
+        # Metadata tree headings, shared by every item
+        self.category_font = QFont("", 10, QFont.Bold)
+        self.group_font = QFont("", 9, QFont.Bold)
     
     def create_header_section(self):
         """Create the header section with logo, title, and buttons"""
@@ -693,12 +1318,11 @@ class MetadataExtractorApp(QMainWindow):
         title_layout.setSpacing(5)
         
         self.title_label = QLabel("🔍 AIM(ADVANCED IMAGE METADATA) FORENSIC EXTRACTOR 🕵️")
-        self.title_label.setFont(self.title_font)
-        self.title_label.setStyleSheet("color: #ffffff;")
+        self.title_label.setObjectName("titleLabel")
         
         self.subtitle_label = QLabel("Professional digital forensics tool for image analysis")
         self.subtitle_label.setFont(self.subtitle_font)
-        self.subtitle_label.setStyleSheet("color: #b0b0b0;")
+        self.subtitle_label.setObjectName("subtitleLabel")
         
         title_layout.addWidget(self.title_label)
         title_layout.addWidget(self.subtitle_label)
@@ -725,9 +1349,16 @@ class MetadataExtractorApp(QMainWindow):
         self.export_button.setEnabled(False)
         self.export_button.setCursor(Qt.PointingHandCursor)
         
+        self.legacy_hash_checkbox = QCheckBox("Legacy hashes (MD5/SHA1)")
+        self.legacy_hash_checkbox.setToolTip("Also compute MD5 and SHA1 for comparison with older case records\n"
+                                             "(SHA-256 and BLAKE2b, plus BLAKE3 when installed, are always computed)")
+        self.legacy_hash_checkbox.toggled.connect(self.on_legacy_hashes_toggled)
+        self.legacy_hash_checkbox.setCursor(Qt.PointingHandCursor)
+        
         button_layout.addWidget(self.open_button)
         button_layout.addWidget(self.save_button)
         button_layout.addWidget(self.export_button)
+        button_layout.addWidget(self.legacy_hash_checkbox)
         
         header_layout.addLayout(title_layout, stretch=4)
         header_layout.addLayout(button_layout, stretch=1)
@@ -749,17 +1380,13 @@ class MetadataExtractorApp(QMainWindow):
         
         self.image_label = QLabel()
         self.image_label.setAlignment(Qt.AlignCenter)
-        self.image_label.setStyleSheet("""
-            background-color: #252535; 
-            border: 2px solid #3a3a4a;
-            border-radius: 5px;
-        """)
+        self.image_label.setObjectName("imageLabel")
         self.image_label.setMinimumSize(300, 300)
         self.image_label.setText("No image loaded")
         
         self.image_info_label = QLabel()
         self.image_info_label.setAlignment(Qt.AlignCenter)
-        self.image_info_label.setStyleSheet("font-size: 12px; color: #b0b0b0;")
+        self.image_info_label.setObjectName("imageInfoLabel")
         self.image_info_label.setText("Select an image to begin analysis")
         
         image_group_layout.addWidget(self.image_label)
@@ -772,7 +1399,7 @@ class MetadataExtractorApp(QMainWindow):
         
         self.forensic_summary = QTextEdit()
         self.forensic_summary.setReadOnly(True)
-        self.forensic_summary.setStyleSheet("font-size: 12px;")
+        self.forensic_summary.setObjectName("forensicSummary")
         forensic_summary_layout.addWidget(self.forensic_summary)
         
         image_preview_layout.addWidget(self.forensic_summary_group)
@@ -792,22 +1419,32 @@ class MetadataExtractorApp(QMainWindow):
         self.forensic_tab_layout = QVBoxLayout(self.forensic_tab)
         
         # Tree view tab
+        tree_toolbar = QHBoxLayout()
+        tree_toolbar.addStretch()
+        self.expand_all_button = QPushButton("➕ Expand All")
+        self.expand_all_button.setToolTip("Expand every metadata group (categories open by default)")
+        self.expand_all_button.setCursor(Qt.PointingHandCursor)
+        self.expand_all_button.clicked.connect(lambda: self.metadata_tree.expandAll())
+        tree_toolbar.addWidget(self.expand_all_button)
+        self.tree_tab_layout.addLayout(tree_toolbar)
+        
         self.metadata_tree = QTreeWidget()
         self.metadata_tree.setHeaderLabels(["Property", "Value"])
         self.metadata_tree.setColumnWidth(0, 350)
-        self.metadata_tree.setAlternatingRowColors(True)
+        # Every row has the same height, so Qt can skip measuring each one
+        self.metadata_tree.setUniformRowHeights(True)
         self.metadata_tree.setFont(self.mono_font)
         self.metadata_tree.setIndentation(15)
         self.tree_tab_layout.addWidget(self.metadata_tree)
         
         # JSON view tab
-        self.json_view = QTextEdit()
+        self.json_view = QPlainTextEdit()  # Plain layout copes with very large reports
         self.json_view.setReadOnly(True)
         self.json_view.setFont(self.mono_font)
         self.json_tab_layout.addWidget(self.json_view)
         
         # Forensic tab
-        self.forensic_view = QTextEdit()
+        self.forensic_view = QPlainTextEdit()
         self.forensic_view.setReadOnly(True)
         self.forensic_view.setFont(self.mono_font)
         self.forensic_tab_layout.addWidget(self.forensic_view)
@@ -816,6 +1453,7 @@ class MetadataExtractorApp(QMainWindow):
         self.metadata_tabs.addTab(self.tree_tab, "📊 Structured View")
         self.metadata_tabs.addTab(self.json_tab, "📝 JSON View")
         self.metadata_tabs.addTab(self.forensic_tab, "🕵️ Forensic Analysis")
+        self.metadata_tabs.currentChanged.connect(self.on_tab_changed)
         
         # Add widgets to splitter
         self.splitter.addWidget(self.image_preview_widget)
@@ -836,31 +1474,47 @@ class MetadataExtractorApp(QMainWindow):
     def update_animations(self):
         """Update UI animations"""
         self.animation_phase = (self.animation_phase + 1) % 360
-        color_index = int((self.animation_phase / 360) * len(self.animation_colors))
-        next_color_index = (color_index + 1) % len(self.animation_colors)
-        
-        # Calculate intermediate color
-        progress = ((self.animation_phase / 360) * len(self.animation_colors)) % 1
-        current_color = self.animation_colors[color_index]
-        next_color = self.animation_colors[next_color_index]
+        self.title_label.setStyleSheet(self.title_styles[self.animation_phase])
+    
+    def update_animation_state(self):
+        """Run the title animation only when someone can see it and no analysis is running"""
+        if (self.isVisible() and self.isActiveWindow() and not self.isMinimized()
+                and not self.analysis_running):
+            if not self.animation_timer.isActive():
+                self.animation_timer.start()
+        else:
+            self.animation_timer.stop()
+    
+    def get_file_dialog(self, kind):
+        """Create the 'open', 'json' or 'txt' file dialog once and reuse it
         
-        r = int(current_color.red() + (next_color.red() - current_color.red()) * progress)
-        g = int(current_color.green() + (next_color.green() - current_color.green()) * progress)
-        b = int(current_color.blue() + (next_color.blue() - current_color.blue()) * progress)
+        Reused dialogs also start in the folder the user picked last time.
+        """
+        file_dialog = self.file_dialogs.get(kind)
+        if file_dialog is not None:
+            return file_dialog
         
-        # Apply to title
-        self.title_label.setStyleSheet(f"""
-            font-size: 16px; 
-            font-weight: bold; 
-            color: rgb({r}, {g}, {b});
-        """)
+        file_dialog = QFileDialog()
+        if kind == 'open':
+            file_dialog.setNameFilter(IMAGE_FILE_FILTER)
+            file_dialog.setFileMode(QFileDialog.ExistingFile)
+            file_dialog.setViewMode(QFileDialog.Detail)
+        elif kind == 'json':
+            file_dialog.setAcceptMode(QFileDialog.AcceptSave)
+            file_dialog.setNameFilter("JSON files (*.json)")
+            file_dialog.setDefaultSuffix("json")
+            file_dialog.setWindowTitle("Save Metadata Report")
+        else:
+            file_dialog.setAcceptMode(QFileDialog.AcceptSave)
+            file_dialog.setNameFilter("Text files (*.txt)")
+            file_dialog.setDefaultSuffix("txt")
+            file_dialog.setWindowTitle("Export Metadata Report")
+        self.file_dialogs[kind] = file_dialog
+        return file_dialog
     
     def open_image(self):
         """Open an image file and extract metadata"""
-        file_dialog = QFileDialog()
-        file_dialog.setNameFilter("Image files (*.jpg *.jpeg *.png *.tiff *.tif *.bmp *.gif *.heic *.webp *.raw)")
-        file_dialog.setFileMode(QFileDialog.ExistingFile)
-        file_dialog.setViewMode(QFileDialog.Detail)
+        file_dialog = self.get_file_dialog('open')
         
         if file_dialog.exec_():
             selected_files = file_dialog.selectedFiles()
@@ -868,6 +1522,73 @@ class MetadataExtractorApp(QMainWindow):
                 self.current_file = selected_files[0]
                 self.analyze_image()
     
+    def selected_hash_algorithms(self):
+        """Return the hash algorithms chosen in the UI"""
+        if self.legacy_hash_checkbox.isChecked():
+            return LEGACY_HASH_ALGORITHMS + DEFAULT_HASH_ALGORITHMS
+        return DEFAULT_HASH_ALGORITHMS
+    
+    def on_legacy_hashes_toggled(self, checked):
+        """Discard computed hashes so they are recomputed with the chosen set"""
+        if self.metadata:
+            self.metadata[_K_INTEGRITY] = HASHES_NOT_COMPUTED
+            self.display_metadata()
+            if self.pending_reports or self.metadata_tabs.currentWidget() is self.forensic_tab:
+                self.ensure_file_hashes()
+    
+    def on_tab_changed(self, index):
+        """Fill the newly shown tab, computing integrity hashes for the forensic tab"""
+        self.render_current_tab()
+        if self.metadata_tabs.widget(index) is self.forensic_tab:
+            self.ensure_file_hashes()
+    
+    def ensure_file_hashes(self):
+        """Start a background hash calculation unless the digests are cached
+        
+        Returns True when the hashes are already in the metadata.
+        """
+        if not self.metadata or not self.current_file:
+            return False
+        if isinstance(self.metadata.get(_K_INTEGRITY), dict):
+            return True
+        
+        algorithms = self.selected_hash_algorithms()
+        if self.hash_job == (self.current_file, algorithms):
+            return False  # Already running
+        self.hash_job = (self.current_file, algorithms)
+        self.status_bar.showMessage("Calculating file hashes...")
+        worker = HashWorker(self.current_file, algorithms)
+        worker.signals.finished.connect(self.on_hashes_ready)
+        worker.signals.error.connect(self.on_hashes_error)
+        self.thread_pool.start(worker)
+        return False
+    
+    def on_hashes_ready(self, image_path, hashes):
+        """Store hashes delivered by a HashWorker if they still apply"""
+        if self.hash_job == (image_path, tuple(hashes)):
+            self.hash_job = None
+        if (not self.metadata or image_path != self.current_file
+                or tuple(hashes) != self.selected_hash_algorithms()
+                or isinstance(self.metadata.get(_K_INTEGRITY), dict)):
+            return  # Outdated: another file, another hash set, or already hashed
+        self.metadata[_K_INTEGRITY] = hashes
+        self.display_metadata()
+        self.status_bar.showMessage(f"File hashes calculated: {os.path.basename(image_path)}")
+        
+        # A report requested while hashing can be written now
+        reports, self.pending_reports = self.pending_reports, []
+        for report in reports:
+            report()
+    
+    def on_hashes_error(self, image_path, message):
+        """Report a failed background hash calculation"""
+        self.hash_job = None
+        if image_path == self.current_file:
+            self.status_bar.showMessage(f"Error calculating file hashes: {message}")
+            if self.pending_reports:
+                self.pending_reports = []
+                QMessageBox.critical(self, "Error", f"Failed to calculate file hashes:\n{message}")
+    
     def analyze_image(self):
         """Analyze the selected image and display metadata"""
         if not self.current_file:
@@ -876,214 +1597,290 @@ class MetadataExtractorApp(QMainWindow):
         # Show progress bar
         self.progress_bar.show()
         self.progress_bar.setValue(0)
-        QApplication.processEvents()
+        
+        # Pause the decorative title animation so the worker gets the CPU
+        self.analysis_running = True
+        self.update_animation_state()
+        
+        # Results for the previous image must not be saved under the new name
+        self.metadata = None
+        self.metadata_json = None
+        self.pending_reports = []
+        self.save_button.setEnabled(False)
+        self.export_button.setEnabled(False)
         
         try:
-            # Load image preview
-            pixmap = QPixmap(self.current_file)
-            if not pixmap.isNull():
-                # Calculate maximum size while maintaining aspect ratio
-                max_size = self.image_label.size()
-                scaled_pixmap = pixmap.scaled(
-                    max_size, 
-                    Qt.KeepAspectRatio, 
-                    Qt.SmoothTransformation
-                )
-                self.image_label.setPixmap(scaled_pixmap)
-                self.image_label.setText("")
-            else:
-                self.image_label.setText("Preview not available")
-                self.image_label.setPixmap(QPixmap())
-            
             # Update file info
             file_size = os.path.getsize(self.current_file)
             self.image_info_label.setText(
                 f"{os.path.basename(self.current_file)}\n"
                 f"{get_human_readable_size(file_size)}"
             )
-            
-            # Extract metadata with progress updates
-            self.progress_bar.setValue(20)
-            QApplication.processEvents()
-            
-            self.metadata = extract_all_metadata(self.current_file)
-            
-            self.progress_bar.setValue(80)
-            QApplication.processEvents()
-            
-            # Display metadata
-            self.display_metadata()
-            
-            self.progress_bar.setValue(100)
-            QApplication.processEvents()
-            
-            # Enable save and export buttons
-            self.save_button.setEnabled(True)
-            self.export_button.setEnabled(True)
-            
-            self.status_bar.showMessage(f"Analysis complete: {os.path.basename(self.current_file)}")
-            
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to analyze image: {str(e)}")
-            self.status_bar.showMessage(f"Error analyzing image: {str(e)}")
-        finally:
-            # Hide progress bar after a short delay
-            QTimer.singleShot(1000, self.progress_bar.hide)
+            self.on_metadata_error(self.current_file, str(e))
+            return
+        
+        # Extract metadata on the thread pool; hashes are computed lazily
+        # when the Forensic Analysis tab is opened
+        self.status_bar.showMessage(f"Analyzing {os.path.basename(self.current_file)}...")
+        # Twice the pane size leaves room for enlarging the window
+        preview_size = (self.image_label.width() * 2, self.image_label.height() * 2)
+        worker = MetadataWorker(self.current_file, preview_size, compute_hashes=False)
+        worker.signals.preview.connect(self.on_preview_ready)
+        worker.signals.progress.connect(self.progress_bar.setValue)
+        worker.signals.finished.connect(self.on_metadata_ready)
+        worker.signals.error.connect(self.on_metadata_error)
+        self.thread_pool.start(worker)
+    
+    def on_preview_ready(self, image_path, image):
+        """Show the preview decoded by a MetadataWorker"""
+        if image_path != self.current_file:
+            return
+        
+        # Keep the full-size pixmap so resizing only rescales it
+        self.preview_pixmap = QPixmap.fromImage(image)
+        if not self.preview_pixmap.isNull():
+            self.apply_scaled_preview()
+            self.image_label.setText("")
+        else:
+            self.image_label.setPixmap(QPixmap())
+            self.image_label.setText("Preview not available")  # setPixmap() clears the text
+    
+    def apply_scaled_preview(self, transformation=Qt.SmoothTransformation):
+        """Scale the cached preview to fit the preview label"""
+        if self.preview_pixmap.isNull():
+            return
+        # Calculate maximum size while maintaining aspect ratio
+        max_size = self.image_label.size()
+        scaled_pixmap = self.preview_pixmap.scaled(
+            max_size, 
+            Qt.KeepAspectRatio, 
+            transformation
+        )
+        self.image_label.setPixmap(scaled_pixmap)
+    
+    def on_metadata_ready(self, image_path, metadata):
+        """Show metadata delivered by a MetadataWorker"""
+        if image_path != self.current_file:
+            return  # Another image was opened while this one was analyzed
+        
+        self.metadata = metadata
+        
+        # Display metadata (and start hashing if the forensic tab is already open)
+        self.display_metadata()
+        if self.metadata_tabs.currentWidget() is self.forensic_tab:
+            self.ensure_file_hashes()
+        
+        self.progress_bar.setValue(100)
+        
+        # Enable save and export buttons
+        self.save_button.setEnabled(True)
+        self.export_button.setEnabled(True)
+        
+        self.status_bar.showMessage(f"Analysis complete: {os.path.basename(self.current_file)}")
+        # Hide progress bar after a short delay
+        QTimer.singleShot(1000, self.progress_bar.hide)
+        self.analysis_running = False
+        self.update_animation_state()
+    
+    def on_metadata_error(self, image_path, message):
+        """Report a failed analysis"""
+        if image_path != self.current_file:
+            return
+        QMessageBox.critical(self, "Error", f"Failed to analyze image: {message}")
+        self.status_bar.showMessage(f"Error analyzing image: {message}")
+        QTimer.singleShot(1000, self.progress_bar.hide)
+        self.analysis_running = False
+        self.update_animation_state()
     
     def display_metadata(self):
         """Display extracted metadata in the UI"""
         if not self.metadata:
             return
         
-        # Clear previous data
-        self.metadata_tree.clear()
-        self.json_view.clear()
-        self.forensic_view.clear()
-        self.forensic_summary.clear()
+        # Raw JSON (serialized once and reused by the JSON tab and the save/export actions)
+        self.metadata_json = metadata_to_json(self.metadata)
         
-        # Display in tree view
-        self.populate_tree_view()
+        # File information block for the TXT export
+        parts = []
+        file_info = self.metadata.get(_K_FILE)
+        if file_info is not None:
+            parts.append("=== FILE INFORMATION ===\n")
+            parts.extend(f"{key}: {value}\n" for key, value in file_info.items())
+            parts.append("\n")
+        self.export_header = "".join(parts)
         
-        # Display raw JSON
-        self.json_view.setPlainText(json.dumps(self.metadata, indent=4))
-        
-        # Display forensic analysis
-        self.display_forensic_analysis()
+        # Forensic analysis text, shown by the forensic tab and exported to TXT
+        self.forensic_text = self.build_forensic_analysis()
         
         # Display forensic summary
-        self.display_forensic_summary()
+        with updates_suspended(self.forensic_summary):
+            self.display_forensic_summary()
+        
+        # Tabs are filled when they are shown; only the visible one is rendered now
+        self.stale_tabs = {self.tree_tab, self.json_tab, self.forensic_tab}
+        self.render_current_tab()
+    
+    def render_current_tab(self):
+        """Fill the visible metadata tab if its contents are out of date"""
+        tab = self.metadata_tabs.currentWidget()
+        if tab not in self.stale_tabs or not self.metadata:
+            return
+        self.stale_tabs.discard(tab)
+        
+        if tab is self.tree_tab:
+            with updates_suspended(self.metadata_tree):
+                self.metadata_tree.clear()
+                self.populate_tree_view()
+        elif tab is self.json_tab:
+            self.json_view.setPlainText(self.metadata_json)
+        elif tab is self.forensic_tab:
+            self.forensic_view.setPlainText(self.forensic_text)
     
     def populate_tree_view(self):
         """Populate the tree widget with metadata"""
+        # Build the whole tree detached, then insert it in one call
+        top_level_items = []
+        pending = []  # (parent item, key, value) worklist, handles any nesting depth
         for category, data in self.metadata.items():
             if category.startswith('⚠️') or category.startswith('❌'):
                 continue
                 
             category_item = QTreeWidgetItem([category])
-            category_item.setFont(0, QFont("", 10, QFont.Bold))
-            self.metadata_tree.addTopLevelItem(category_item)
+            category_item.setFont(0, self.category_font)
+            top_level_items.append(category_item)
             
             if isinstance(data, dict):
-                for key, value in data.items():
-                    if isinstance(value, dict):
-                        sub_item = QTreeWidgetItem([key])
-                        sub_item.setFont(0, QFont("", 9, QFont.Bold))
-                        category_item.addChild(sub_item)
-                        for sub_key, sub_value in value.items():
-                            sub_sub_item = QTreeWidgetItem([sub_key, str(sub_value)])
-                            sub_item.addChild(sub_sub_item)
-                    else:
-                        item = QTreeWidgetItem([key, str(value)])
-                        category_item.addChild(item)
+                # Reversed so popping yields the original order
+                pending.extend((category_item, key, value) for key, value in reversed(data.items()))
             else:
-                item = QTreeWidgetItem([str(data)])
-                category_item.addChild(item)
-        
-        self.metadata_tree.expandAll()
-        self.metadata_tree.resizeColumnToContents(0)
+                category_item.addChild(QTreeWidgetItem([data if isinstance(data, str) else str(data)]))
+        
+        while pending:
+            parent, key, value = pending.pop()
+            key = key if isinstance(key, str) else str(key)
+            if isinstance(value, dict):
+                item = QTreeWidgetItem([key])
+                item.setFont(0, self.group_font)
+                pending.extend((item, sub_key, sub_value) for sub_key, sub_value in reversed(value.items()))
+            else:
+                item = QTreeWidgetItem([key, value if isinstance(value, str) else str(value)])
+            parent.addChild(item)
+        
+        self.metadata_tree.setSortingEnabled(False)
+        with updates_suspended(self.metadata_tree):
+            self.metadata_tree.addTopLevelItems(top_level_items)
+            # Only the categories open by default, so layout cost follows the
+            # visible rows; the Expand All button opens the rest
+            for category_item in top_level_items:
+                category_item.setExpanded(True)
+            # Column 0 keeps its fixed width; measuring every row's text is skipped
     
-    def display_forensic_analysis(self):
-        """Display forensic analysis information"""
-        if not self.metadata:
-            return
-        
-        analysis_text = "=== FORENSIC ANALYSIS REPORT ===\n\n"
+    def build_forensic_analysis(self):
+        """Render the forensic analysis report as text"""
+        parts = ["=== FORENSIC ANALYSIS REPORT ===\n\n"]
         
         # File integrity
-        if '🔒 File Integrity' in self.metadata:
-            analysis_text += "=== FILE INTEGRITY ===\n"
-            for hash_name, hash_value in self.metadata['🔒 File Integrity'].items():
-                analysis_text += f"{hash_name}: {hash_value}\n"
-            analysis_text += "\n"
+        integrity = self.metadata.get(_K_INTEGRITY)
+        if integrity is not None:
+            parts.append("=== FILE INTEGRITY ===\n")
+            if isinstance(integrity, dict):
+                parts.extend(f"{hash_name}: {hash_value}\n"
+                             for hash_name, hash_value in integrity.items())
+            else:
+                parts.append(f"{integrity}\n")
+            parts.append("\n")
         
         # Forensic indicators
-        if '🕵️‍♂️ Forensic Analysis' in self.metadata:
-            analysis_text += "=== FORENSIC INDICATORS ===\n"
-            for indicator, value in self.metadata['🕵️‍♂️ Forensic Analysis'].items():
-                analysis_text += f"{indicator}: {value}\n"
-            analysis_text += "\n"
+        forensic_info = self.metadata.get(_K_FORENSIC)
+        if forensic_info is not None:
+            parts.append("=== FORENSIC INDICATORS ===\n")
+            parts.extend(f"{indicator}: {value}\n"
+                         for indicator, value in forensic_info.items())
+            parts.append("\n")
         
         # Warnings
-        if '⚠️ Warnings' in self.metadata and self.metadata['⚠️ Warnings']:
-            analysis_text += "=== WARNINGS ===\n"
-            for warning in self.metadata['⚠️ Warnings']:
-                analysis_text += f"• {warning}\n"
-            analysis_text += "\n"
+        warnings = self.metadata.get(_K_WARN)
+        if warnings:
+            parts.append("=== WARNINGS ===\n")
+            parts.extend(f"• {warning}\n" for warning in warnings)
+            parts.append("\n")
         
         # Critical errors
-        if '❌ Critical Error' in self.metadata:
-            analysis_text += "=== CRITICAL ERROR ===\n"
-            analysis_text += self.metadata['❌ Critical Error'] + "\n"
-            if '❌ Stack Trace' in self.metadata:
-                analysis_text += "\nStack Trace:\n" + self.metadata['❌ Stack Trace']
-            analysis_text += "\n"
-        
-        self.forensic_view.setPlainText(analysis_text)
+        critical_error = self.metadata.get(_K_ERR)
+        if critical_error is not None:
+            parts.append("=== CRITICAL ERROR ===\n")
+            parts.append(critical_error + "\n")
+            stack_trace = self.metadata.get(_K_TRACE)
+            if stack_trace is not None:
+                parts.append("\nStack Trace:\n" + stack_trace)
+            parts.append("\n")
+        
+        return "".join(parts)
     
     def display_forensic_summary(self):
         """Display forensic summary in the preview panel"""
         if not self.metadata:
             return
         
-        summary_text = ""
-        
+        parts = []
         
         # Basic file info
-        if '📁 File Information' in self.metadata:
-            file_info = self.metadata['📁 File Information']
-            summary_text += f"📄 File: {file_info.get('File Name', 'Unknown')}\n"
-            summary_text += f"📏 Size: {file_info.get('File Size', 'Unknown')}\n"
-            summary_text += f"🖼️ Dimensions: {file_info.get('Width', '?')} x {file_info.get('Height', '?')}\n"
-            summary_text += f"📅 Modified: {file_info.get('Modified', 'Unknown')}\n\n"
+        file_info = self.metadata.get(_K_FILE)
+        if isinstance(file_info, dict):
+            parts.append(f"📄 File: {file_info.get('File Name', 'Unknown')}\n")
+            parts.append(f"📏 Size: {file_info.get('File Size', 'Unknown')}\n")
+            parts.append(f"🖼️ Dimensions: {file_info.get('Width', '?')} x {file_info.get('Height', '?')}\n")
+            parts.append(f"📅 Modified: {file_info.get('Modified', 'Unknown')}\n\n")
         
         # Camera/device info
-        if '📷 Camera Information' in self.metadata and isinstance(self.metadata['📷 Camera Information'], dict):
-            camera_info = self.metadata['📷 Camera Information']
-            summary_text += "📷 Camera/Device:\n"
+        camera_info = self.metadata.get(_K_CAM)
+        if isinstance(camera_info, dict):
+            parts.append("📷 Camera/Device:\n")
             if 'Manufacturer' in camera_info:
-                summary_text += f"• Make: {camera_info['Manufacturer']}\n"
+                parts.append(f"• Make: {camera_info['Manufacturer']}\n")
             if 'Model' in camera_info:
-                summary_text += f"• Model: {camera_info['Model']}\n"
+                parts.append(f"• Model: {camera_info['Model']}\n")
             if 'Software' in camera_info:
-                summary_text += f"• Software: {camera_info['Software']}\n"
-            summary_text += "\n"
+                parts.append(f"• Software: {camera_info['Software']}\n")
+            parts.append("\n")
         
         # Location info
-        if '📍 GPS & Location Data' in self.metadata and isinstance(self.metadata['📍 GPS & Location Data'], dict):
-            gps_info = self.metadata['📍 GPS & Location Data']
-            summary_text += "📍 Location Data:\n"
+        gps_info = self.metadata.get(_K_GPS)
+        if isinstance(gps_info, dict):
+            parts.append("📍 Location Data:\n")
             if 'Latitude' in gps_info and 'Longitude' in gps_info:
-                summary_text += f"• Coordinates: {gps_info['Latitude']}, {gps_info['Longitude']}\n"
+                parts.append(f"• Coordinates: {gps_info['Latitude']}, {gps_info['Longitude']}\n")
             if 'Altitude' in gps_info:
-                summary_text += f"• Altitude: {gps_info['Altitude']}\n"
-            summary_text += "\n"
+                parts.append(f"• Altitude: {gps_info['Altitude']}\n")
+            parts.append("\n")
         
         # Forensic indicators
-        if '🕵️‍♂️ Forensic Analysis' in self.metadata:
-            forensic_info = self.metadata['🕵️‍♂️ Forensic Analysis']
-            summary_text += "🕵️‍♂️ Forensic Indicators:\n"
+        forensic_info = self.metadata.get(_K_FORENSIC)
+        if forensic_info is not None:
+            parts.append("🕵️‍♂️ Forensic Indicators:\n")
             
             warning_count = 0
             for indicator, value in forensic_info.items():
                 if isinstance(value, str) and ("detected" in value.lower() or "possible" in value.lower()):
-                    summary_text += f"⚠️ {indicator}: {value}\n"
+                    parts.append(f"⚠️ {indicator}: {value}\n")
                     warning_count += 1
             
             if warning_count == 0:
-                summary_text += "✅ No suspicious indicators detected\n"
+                parts.append("✅ No suspicious indicators detected\n")
         
-        self.forensic_summary.setPlainText(summary_text)
+        self.forensic_summary.setPlainText("".join(parts))
     
     def save_report(self):
         """Save metadata report to JSON file"""
         if not self.metadata:
             return
+        if not self.ensure_file_hashes():
+            if self.save_report not in self.pending_reports:
+                self.pending_reports.append(self.save_report)  # Resumed from on_hashes_ready
+            return
         
-        file_dialog = QFileDialog()
-        file_dialog.setAcceptMode(QFileDialog.AcceptSave)
-        file_dialog.setNameFilter("JSON files (*.json)")
-        file_dialog.setDefaultSuffix("json")
-        file_dialog.setWindowTitle("Save Metadata Report")
+        file_dialog = self.get_file_dialog('json')
         
         # Suggest a filename based on the image
         if self.current_file:
@@ -1095,8 +1892,8 @@ class MetadataExtractorApp(QMainWindow):
             if selected_files:
                 output_path = selected_files[0]
                 try:
-                    with open(output_path, 'w') as f:
-                        json.dump(self.metadata, f, indent=4)
+                    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                        f.write(self.metadata_json)
                     
                     # Show success message with path
                     msg = QMessageBox(self)
@@ -1107,7 +1904,7 @@ class MetadataExtractorApp(QMainWindow):
                     
                     # Add button to open containing folder
                     open_button = msg.addButton("Open Folder", QMessageBox.ActionRole)
-                    open_button.clicked.connect(lambda: webbrowser.open(os.path.dirname(output_path)))
+                    open_button.clicked.connect(lambda: open_folder(os.path.dirname(output_path)))
                     
                     msg.exec_()
                 except Exception as e:
@@ -1117,12 +1914,12 @@ class MetadataExtractorApp(QMainWindow):
         """Export metadata report to text file"""
         if not self.metadata:
             return
+        if not self.ensure_file_hashes():
+            if self.export_to_txt not in self.pending_reports:
+                self.pending_reports.append(self.export_to_txt)  # Resumed from on_hashes_ready
+            return
         
-        file_dialog = QFileDialog()
-        file_dialog.setAcceptMode(QFileDialog.AcceptSave)
-        file_dialog.setNameFilter("Text files (*.txt)")
-        file_dialog.setDefaultSuffix("txt")
-        file_dialog.setWindowTitle("Export Metadata Report")
+        file_dialog = self.get_file_dialog('txt')
         
         # Suggest a filename based on the image
         if self.current_file:
@@ -1134,25 +1931,13 @@ class MetadataExtractorApp(QMainWindow):
             if selected_files:
                 output_path = selected_files[0]
                 try:
-                    with open(output_path, 'w', encoding='utf-8') as f:
-                        # Write header
-                        f.write("="*80 + "\n")
-                        f.write("IMAGE METADATA FORENSIC REPORT\n".center(80) + "\n")
-                        f.write("="*80 + "\n\n")
-                        
-                        # Write basic info
-                        if '📁 File Information' in self.metadata:
-                            f.write("=== FILE INFORMATION ===\n")
-                            for key, value in self.metadata['📁 File Information'].items():
-                                f.write(f"{key}: {value}\n")
-                            f.write("\n")
-                        
-                        # Write forensic info
-                        f.write(self.forensic_view.toPlainText())
-                        
-                        # Write all metadata
+                    # Every section was already rendered by display_metadata()
+                    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                        f.write(TXT_REPORT_BANNER)
+                        f.write(self.export_header)
+                        f.write(self.forensic_text)
                         f.write("\n=== COMPLETE METADATA ===\n")
-                        f.write(json.dumps(self.metadata, indent=4))
+                        f.write(self.metadata_json)
                     
                     # Show success message with path
                     msg = QMessageBox(self)
@@ -1163,31 +1948,79 @@ class MetadataExtractorApp(QMainWindow):
                     
                     # Add button to open containing folder
                     open_button = msg.addButton("Open Folder", QMessageBox.ActionRole)
-                    open_button.clicked.connect(lambda: webbrowser.open(os.path.dirname(output_path)))
+                    open_button.clicked.connect(lambda: open_folder(os.path.dirname(output_path)))
                     
                     msg.exec_()
                 except Exception as e:
                     QMessageBox.critical(self, "Error", f"Failed to export report:\n{str(e)}")
     
+    def changeEvent(self, event):
+        """Pause the title animation while the window is inactive or minimized"""
+        super().changeEvent(event)
+        if event.type() in (QEvent.ActivationChange, QEvent.WindowStateChange):
+            if hasattr(self, 'animation_timer'):
+                self.update_animation_state()
+    
+    def showEvent(self, event):
+        """Start the title animation once the window appears"""
+        super().showEvent(event)
+        self.update_animation_state()
+    
+    def hideEvent(self, event):
+        """Stop the title animation while the window is hidden"""
+        super().hideEvent(event)
+        self.animation_timer.stop()
+    
     def resizeEvent(self, event):
         """Handle window resize events to update image preview"""
         super().resizeEvent(event)
-        if self.current_file and hasattr(self, 'image_label') and not self.image_label.pixmap().isNull():
-            pixmap = QPixmap(self.current_file)
-            max_size = self.image_label.size()
-            scaled_pixmap = pixmap.scaled(
-                max_size, 
-                Qt.KeepAspectRatio, 
-                Qt.SmoothTransformation
-            )
-            self.image_label.setPixmap(scaled_pixmap)
+        # Dragging the window edge fires many resize events: follow it with a
+        # cheap nearest-neighbour scale and smooth it once resizing settles
+        if hasattr(self, 'preview_resize_timer'):
+            self.apply_scaled_preview(Qt.FastTransformation)
+            self.preview_resize_timer.start()
 
 # ======================
 # 🚀 APPLICATION START
 # ======================
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
+    parser = argparse.ArgumentParser(description="AIM (Advanced Image Metadata) Forensic Extractor")
+    parser.add_argument('images', nargs='*', help="Image file(s) or directories to analyze")
+    parser.add_argument('--batch', action='store_true',
+                        help="Analyze all given images without the GUI and print a JSON report")
+    parser.add_argument('--workers', '--max-concurrency', type=int, default=None,
+                        help="Number of worker processes for --batch (default: CPU count)")
+    parser.add_argument('--legacy-hashes', action='store_true',
+                        help="With --batch, also compute MD5 and SHA1 "
+                             "(only SHA-256/BLAKE2b, plus BLAKE3 when installed, by default)")
+    parser.add_argument('--hash-cache', action='store_true',
+                        help="Reuse digests of unchanged files (same device, inode, size and mtime) "
+                             "from ~/.cache/aim-forensic/hashes.db instead of re-reading them")
+    parser.add_argument('--output-dir', default=None,
+                        help="With --batch, write one <name>_metadata.json per image here "
+                             "instead of printing a combined report")
+    args, qt_args = parser.parse_known_args()
+    if args.hash_cache:
+        os.environ['AIM_HASH_CACHE'] = '1'  # Inherited by batch worker processes
+    
+    if args.batch:
+        hash_algorithms = DEFAULT_HASH_ALGORITHMS
+        if args.legacy_hashes:
+            hash_algorithms = LEGACY_HASH_ALGORITHMS + hash_algorithms
+        results = extract_batch(collect_image_paths(args.images), workers=args.workers,
+                                hash_algorithms=hash_algorithms)
+        if args.output_dir:
+            for report_path in write_batch_reports(results, args.output_dir):
+                print(report_path)
+        else:
+            # Same format as the per-file reports; emoji keys need UTF-8 even
+            # where the console's default encoding (e.g. cp1252) can't take them
+            sys.stdout.reconfigure(encoding='utf-8')
+            sys.stdout.write(metadata_to_json(results) + "\n")
+        sys.exit(0)
+    
+    app = QApplication(sys.argv[:1] + qt_args)
     
     # Set application style and font
     app.setStyle('Fusion')
@@ -1197,8 +2030,8 @@ if __name__ == "__main__":
     window.show()
     
     # Check for command line argument
-    if len(sys.argv) > 1:
-        image_path = sys.argv[1]
+    if args.images:
+        image_path = args.images[0]
         if os.path.exists(image_path):
             window.current_file = image_path
             QTimer.singleShot(100, window.analyze_image)